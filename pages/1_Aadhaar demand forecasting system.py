@@ -1,14 +1,14 @@
 import streamlit as st
-import numpy as np
-import joblib
 from datetime import datetime
 
-# ---------------- Load ML Pipeline ----------------
-data = joblib.load("models/aadhaar_demand_forecasting_pipeline.pkl")
+from utils.encoding import forecast_encoders
+from utils.forecast import forecast_demand
 
-model = data['model']
-le_state = data['state_encoder']
-le_district = data['district_encoder']
+# ---------------- Load ML Pipeline ----------------
+# Dict lookups built once from the pipeline's LabelEncoders (utils/encoding.py)
+encoders = forecast_encoders()
+le_state = encoders['state']
+le_district = encoders['district']
 
 # ---------------- Streamlit Page Config ----------------
 st.set_page_config(
@@ -63,21 +63,10 @@ enrolment_count = st.number_input(
 # ---------------- Prediction ----------------
 if st.button("🔮 Predict Aadhaar Demand"):
     try:
-        state_encoded = le_state.transform([state])[0]
-        district_encoded = le_district.transform([district])[0]
-
-        X = np.array([[
-            state_encoded,
-            district_encoded,
-            pincode,
-            bio_5_17,
-            bio_17_plus,
-            enrolment_count,
-            month,
-            year
-        ]])
-
-        prediction = model.predict(X)[0]
+        # Cached per pipeline version and inputs (utils/forecast.py)
+        prediction = forecast_demand(
+            state, district, pincode, bio_5_17, bio_17_plus, enrolment_count, month, year
+        )
 
         st.success(
             f"📈 **Expected Aadhaar Service Demand:** {int(prediction)}"
@@ -1,6 +1,8 @@
 import streamlit as st
-import pandas as pd
-import joblib
+
+from utils.background import render_section
+from utils.features import HOTSPOT_DATASET, hotspot_distribution_section, hotspot_table_section
+from utils.quality import clean_dataset
 
 # =========================
 # PAGE CONFIG
@@ -17,41 +19,12 @@ st.write(
     "using clustering on UIDAI biometric update data."
 )
 
-# =========================
-# LOAD MODEL & SCALER
-# =========================
-kmeans = joblib.load("models/hotspot_kmeans_model.pkl")
-scaler = joblib.load("models/hotspot_scaler.pkl")
-
 # =========================
 # LOAD DATA
 # =========================
-df = pd.read_csv("datasets/2_uidai_biometric.xls")
-
-# =========================
-# FEATURE ENGINEERING
-# =========================
-X = df[['total_biometric_updates']]
-X_scaled = scaler.transform(X)
-
-df['cluster'] = kmeans.predict(X_scaled)
-
-# =========================
-# CLUSTER INTERPRETATION
-# =========================
-cluster_means = df.groupby('cluster')['total_biometric_updates'].mean()
-low_cluster = cluster_means.idxmin()
-high_cluster = cluster_means.idxmax()
-
-def label_cluster(c):
-    if c == low_cluster:
-        return "Low Demand"
-    elif c == high_cluster:
-        return "High Demand"
-    else:
-        return "Medium Demand"
-
-df['hotspot_label'] = df['cluster'].apply(label_cluster)
+# Only the validated dataset is needed for the sidebar and headline metrics;
+# the clustering runs in the background (utils/features.py, utils/background.py)
+df = clean_dataset(HOTSPOT_DATASET)
 
 # =========================
 # SIDEBAR FILTERS
@@ -68,28 +41,33 @@ demand_filter = st.sidebar.selectbox(
     ["All", "High Demand", "Medium Demand", "Low Demand"]
 )
 
-# Apply state filter
-if state_filter != "All":
-    filtered_df = df[df['state'] == state_filter]
-else:
-    filtered_df = df.copy()
+# =========================
+# HEADLINE METRICS
+# =========================
+state_rows = df if state_filter == "All" else df[df['state'] == state_filter]
 
-# Apply demand filter
-if demand_filter != "All":
-    filtered_df = filtered_df[filtered_df['hotspot_label'] == demand_filter]
+col1, col2, col3 = st.columns(3)
+col1.metric("Records in State", len(state_rows))
+col2.metric("Districts in State", state_rows['district'].nunique())
+col3.metric("Total Biometric Updates", f"{int(state_rows['total_biometric_updates'].sum()):,}")
 
 # =========================
 # DATA OUTPUT
 # =========================
 st.subheader("📊 Filtered Hotspot Data")
-st.dataframe(
-    filtered_df[['state', 'district', 'pincode', 'total_biometric_updates', 'hotspot_label']]
-    .sort_values(by='total_biometric_updates', ascending=False)
-)
 
-st.metric(
-    label="Number of Districts in Selection",
-    value=len(filtered_df)
+
+def show_table(table):
+    st.dataframe(table)
+    st.metric(
+        label="Number of Districts in Selection",
+        value=len(table)
+    )
+
+
+render_section(
+    "hotspot_table", (state_filter, demand_filter),
+    hotspot_table_section, (state_filter, demand_filter), show_table
 )
 
 # =========================
@@ -97,16 +75,10 @@ st.metric(
 # =========================
 st.subheader("📈 Demand Distribution in Selected State")
 
-# Only show chart for selected state
-if state_filter != "All":
-    dist_counts = df[df['state'] == state_filter]['hotspot_label'].value_counts()
-else:
-    dist_counts = df['hotspot_label'].value_counts()
-
-# Convert counts to percentage
-dist_percent = (dist_counts / dist_counts.sum() * 100).round(2)
-
-st.bar_chart(dist_percent)
+render_section(
+    "hotspot_distribution", (state_filter,),
+    hotspot_distribution_section, (state_filter,), st.bar_chart
+)
 
 # =========================
 # FOOTER
@@ -1,6 +1,11 @@
 import streamlit as st
-import pandas as pd
-import joblib
+
+from utils.background import render_section
+from utils.features import (
+    AGE_GROUP_DATASET, age_group_distribution_section, age_group_insights_section,
+    age_group_table_section,
+)
+from utils.quality import clean_dataset
 
 # =========================
 # PAGE CONFIG
@@ -17,43 +22,13 @@ st.write(
     "optimize UIDAI infrastructure at **pincode level**."
 )
 
-# =========================
-# LOAD MODEL & SCALER
-# =========================
-kmeans = joblib.load("models/age_group_kmeans_model.pkl")
-scaler = joblib.load("models/age_group_scaler.pkl")
-
 # =========================
 # LOAD DATA
 # =========================
-df = pd.read_csv("datasets/uidai_biometric.xls")
-
-# =========================
-# FEATURE ENGINEERING
-# =========================
-df['total_biometric_updates'] = df['bio_age_5_17'] + df['bio_age_17_']
-df = df[df['total_biometric_updates'] > 0]
-
-df['age_5_17_ratio'] = df['bio_age_5_17'] / df['total_biometric_updates']
-df['age_17_plus_ratio'] = df['bio_age_17_'] / df['total_biometric_updates']
-
-X = df[['age_5_17_ratio', 'age_17_plus_ratio']]
-X_scaled = scaler.transform(X)
-
-df['cluster'] = kmeans.predict(X_scaled)
-
-# =========================
-# CLUSTER INTERPRETATION
-# =========================
-def label_cluster(row):
-    if row['age_5_17_ratio'] > 0.6:
-        return "Child-Dominant Demand (5–17)"
-    elif row['age_17_plus_ratio'] > 0.6:
-        return "Adult-Dominant Demand (17+)"
-    else:
-        return "Balanced Demand"
-
-df['age_group_category'] = df.apply(label_cluster, axis=1)
+# Only the validated dataset is needed for the sidebar and headline metrics;
+# ratios, clusters and age-group categories are computed in the background
+# (utils/features.py, utils/background.py)
+df = clean_dataset(AGE_GROUP_DATASET)
 
 # =========================
 # SIDEBAR FILTERS
@@ -72,59 +47,40 @@ district_filter = st.sidebar.selectbox(
     )
 )
 
-filtered_df = df[df['state'] == state_filter]
+selection = (state_filter, district_filter)
 
+# =========================
+# HEADLINE METRICS
+# =========================
+selected_rows = df[df['state'] == state_filter]
 if district_filter != "All":
-    filtered_df = filtered_df[filtered_df['district'] == district_filter]
+    selected_rows = selected_rows[selected_rows['district'] == district_filter]
+
+col1, col2, col3 = st.columns(3)
+col1.metric("Number of Pincodes Analyzed", len(selected_rows))
+col2.metric("Biometric (Age 5–17)", f"{int(selected_rows['bio_age_5_17'].sum()):,}")
+col3.metric("Biometric (Age 17+)", f"{int(selected_rows['bio_age_17_'].sum()):,}")
 
 # =========================
 # OUTPUT TABLE
 # =========================
 st.subheader("📊 Age-Group Demand Analysis")
 
-st.dataframe(
-    filtered_df[
-        ['state', 'district', 'pincode',
-         'bio_age_5_17', 'bio_age_17_',
-         'age_group_category']
-    ]
-)
-
-st.metric(
-    label="Number of Pincodes Analyzed",
-    value=len(filtered_df)
-)
+render_section("age_group_table", selection, age_group_table_section, selection, st.dataframe)
 
 # =========================
 # PERCENTAGE VISUALIZATION
 # =========================
 st.subheader("📈 Age-Group Demand Distribution (%)")
 
-age_counts = filtered_df['age_group_category'].value_counts()
-age_percent = (age_counts / age_counts.sum() * 100).round(2)
-
-st.bar_chart(age_percent)
+render_section("age_group_distribution", selection, age_group_distribution_section, selection, st.bar_chart)
 
 # =========================
 # SERVICE INSIGHTS
 # =========================
 st.subheader("🛠 Service Optimization Insights")
 
-def recommendation(category):
-    if "Child" in category:
-        return "Deploy school-based enrollment camps & child biometric kits"
-    elif "Adult" in category:
-        return "Increase adult service counters & working-hour availability"
-    else:
-        return "Maintain balanced staffing & infrastructure"
-
-filtered_df['service_recommendation'] = filtered_df['age_group_category'].apply(recommendation)
-
-st.dataframe(
-    filtered_df[
-        ['pincode', 'age_group_category', 'service_recommendation']
-    ]
-)
+render_section("age_group_insights", selection, age_group_insights_section, selection, st.dataframe)
 
 # =========================
 # FOOTER
@@ -1,7 +1,9 @@
 import streamlit as st
-import pandas as pd
-import joblib
-import matplotlib.pyplot as plt
+
+# Districts are scored once per process and shared across sessions
+from utils.neighbours import SPACES, similar_districts
+from utils.priority import cluster_levels, level_label, recommended_action, state_chart, state_index, states
+from utils.scenarios import render_scenario_panel
 
 # ===============================
 # PAGE CONFIG
@@ -17,26 +19,6 @@ st.write(
     "for Aadhaar infrastructure and biometric service planning."
 )
 
-# ===============================
-# LOAD MODEL & SCALER
-# ===============================
-model = joblib.load("models/policy_kmeans_model.pkl")
-scaler = joblib.load("models/policy_scaler.pkl")
-
-# ===============================
-# LOAD DATA
-# ===============================
-df = pd.read_csv("datasets/biometric_demographic_merge.xls")
-
-features = [
-    "bio_age_5_17",
-    "bio_age_17_",
-    "total_population",
-    "age_group_population"
-]
-
-df = df.dropna(subset=features)
-
 # ===============================
 # SIDEBAR FILTERS
 # ===============================
@@ -44,10 +26,10 @@ st.sidebar.header("🔍 Select Location")
 
 state = st.sidebar.selectbox(
     "Select State",
-    sorted(df["state"].unique())
+    states("policy")
 )
 
-state_df = df[df["state"] == state]
+state_df = state_index("policy")[state]
 
 district = st.sidebar.selectbox(
     "Select District",
@@ -71,84 +53,50 @@ c4.metric("Age Group Population", int(selected_row["age_group_population"]))
 # ===============================
 # POLICY PRIORITY PREDICTION
 # ===============================
-input_data = [[
-    selected_row["bio_age_5_17"],
-    selected_row["bio_age_17_"],
-    selected_row["total_population"],
-    selected_row["age_group_population"]
-]]
-
-scaled_input = scaler.transform(input_data)
-cluster = model.predict(scaled_input)[0]
-
-priority_labels = {
-    0: "🟢 Low Priority",
-    1: "🟡 Medium Priority",
-    2: "🔴 High Priority"
-}
+# Cluster -> priority level mapping comes from models/manifest.json
+level = cluster_levels("policy")[int(selected_row["cluster"])]
 
 st.subheader("📌 Policy Priority Level")
-st.success(priority_labels[cluster])
+st.success(level_label("policy", selected_row["cluster"]))
 
 # ===============================
 # POLICY RECOMMENDATION
 # ===============================
 st.subheader("📝 Recommended Policy Action")
 
-if cluster == 2:
-    st.error(
-        """
-        **Immediate Action Required**
-        - Deploy mobile Aadhaar enrollment units
-        - Increase biometric operators & devices
-        - Conduct school & rural enrollment drives
-        """
-    )
-elif cluster == 1:
-    st.warning(
-        """
-        **Moderate Policy Attention Needed**
-        - Improve existing Aadhaar centers
-        - Awareness campaigns for enrollment
-        """
-    )
-else:
-    st.info(
-        """
-        **Infrastructure Sufficient**
-        - Continue monitoring demand
-        - Maintain current service capacity
-        """
-    )
+alert, action = recommended_action("policy", level)
+getattr(st, alert)(action)
 
 # ===============================
-# STATE-LEVEL DISTRIBUTION
+# SIMILAR DISTRICTS
 # ===============================
-st.subheader("📈 State-Level Policy Priority Distribution (%)")
-
-X_state = state_df[features]
-X_state_scaled = scaler.transform(X_state)
-state_clusters = model.predict(X_state_scaled)
+st.subheader("🧭 Similar Districts")
 
-priority_percent = (
-    pd.Series(state_clusters)
-    .value_counts(normalize=True)
-    .mul(100)
+space = st.radio(
+    "Compare using",
+    list(SPACES),
+    format_func=SPACES.__getitem__,
+    horizontal=True
 )
+k = st.slider("Number of similar districts", min_value=3, max_value=20, value=5)
 
-labels = ["Low Priority", "Medium Priority", "High Priority"]
-values = [
-    priority_percent.get(0, 0),
-    priority_percent.get(1, 0),
-    priority_percent.get(2, 0)
-]
+similar = similar_districts(space, state, district, k)
+if similar is None:
+    st.info(f"{district} is not available in the {SPACES[space].lower()} dataset.")
+else:
+    st.dataframe(similar, hide_index=True)
 
-fig, ax = plt.subplots()
-ax.bar(labels, values)
-ax.set_ylabel("Percentage (%)")
-ax.set_title(f"Policy Priority Distribution in {state}")
+# ===============================
+# WHAT-IF SCENARIOS
+# ===============================
+render_scenario_panel("policy", state)
+
+# ===============================
+# STATE-LEVEL DISTRIBUTION
+# ===============================
+st.subheader("📈 State-Level Policy Priority Distribution (%)")
 
-st.pyplot(fig)
+st.image(state_chart("policy", state))
 
 # ===============================
 # FOOTER
@@ -1,7 +1,8 @@
 import streamlit as st
-import pandas as pd
-import joblib
-import matplotlib.pyplot as plt
+
+# Districts are scored once per process and shared across sessions
+from utils.priority import cluster_levels, level_label, recommended_action, state_chart, state_index, states
+from utils.scenarios import render_scenario_panel
 
 # ===============================
 # PAGE CONFIG
@@ -17,19 +18,6 @@ st.write(
     "based on district-level biometric activity and enrollments."
 )
 
-# ===============================
-# LOAD MODEL & SCALER
-# ===============================
-kmeans = joblib.load("models/infra_kmeans_model.pkl")
-scaler = joblib.load("models/infra_scaler.pkl")
-
-# ===============================
-# LOAD DATASET
-# ===============================
-df = pd.read_csv("datasets/biometric_enrolment_merge.xls")  # Replace with your CSV file
-features = ["bio_age_5_17", "bio_age_17_", "enrolment_count"]
-df = df.dropna(subset=features)
-
 # ===============================
 # SIDEBAR FILTERS
 # ===============================
@@ -37,10 +25,10 @@ st.sidebar.header("🔍 Select Location")
 
 state = st.sidebar.selectbox(
     "Select State",
-    sorted(df["state"].unique())
+    states("infra")
 )
 
-state_df = df[df["state"] == state]
+state_df = state_index("infra")[state]
 
 district = st.sidebar.selectbox(
     "Select District",
@@ -62,30 +50,9 @@ c3.metric("Enrollment Count", int(selected_row["enrolment_count"]))
 # ===============================
 # PREDICT PRIORITY
 # ===============================
-input_data = [[
-    selected_row["bio_age_5_17"],
-    selected_row["bio_age_17_"],
-    selected_row["enrolment_count"]
-]]
-
-scaled_input = scaler.transform(input_data)
-cluster = kmeans.predict(scaled_input)[0]
-
-# Determine low, medium, high clusters based on mean enrollment
-cluster_means = df.groupby('cluster')['enrolment_count'].mean() if 'cluster' in df.columns else pd.Series([0,0,0], index=[0,1,2])
-low_cluster = cluster_means.idxmin()
-high_cluster = cluster_means.idxmax()
-medium_cluster = list(set([0,1,2]) - {low_cluster, high_cluster})[0]
-
-def label_cluster(c):
-    if c == low_cluster:
-        return "🟢 Low Priority"
-    elif c == high_cluster:
-        return "🔴 High Priority"
-    else:
-        return "🟡 Medium Priority"
-
-priority_label = label_cluster(cluster)
+# Cluster -> level mapping comes from the model manifest (utils/registry.py)
+level = cluster_levels("infra")[int(selected_row["cluster"])]
+priority_label = level_label("infra", selected_row["cluster"])
 
 st.subheader("📌 Infrastructure Priority Level")
 st.success(priority_label)
@@ -95,55 +62,20 @@ st.success(priority_label)
 # ===============================
 st.subheader("📝 Recommended Policy Action")
 
-if priority_label == "🔴 High Priority":
-    st.error(
-        """
-        **Immediate Action Required**
-        - Deploy additional enrollment centers / mobile units
-        - Increase operators and devices
-        - Conduct awareness campaigns in schools and rural areas
-        """
-    )
-elif priority_label == "🟡 Medium Priority":
-    st.warning(
-        """
-        **Moderate Policy Attention Needed**
-        - Optimize existing enrollment centers
-        - Plan for expansion in near future
-        """
-    )
-else:
-    st.info(
-        """
-        **Low Priority**
-        - Maintain current infrastructure
-        - Monitor growth in enrollments
-        """
-    )
+alert, action = recommended_action("infra", level)
+getattr(st, alert)(action)
+
+# ===============================
+# WHAT-IF SCENARIOS
+# ===============================
+render_scenario_panel("infra", state)
 
 # ===============================
 # STATE-LEVEL DISTRIBUTION
 # ===============================
 st.subheader("📈 State-Level Priority Distribution (%)")
 
-X_state = state_df[features]
-X_state_scaled = scaler.transform(X_state)
-state_clusters = kmeans.predict(X_state_scaled)
-
-priority_percent = pd.Series(state_clusters).value_counts(normalize=True).mul(100)
-
-labels = ["Low Priority", "Medium Priority", "High Priority"]
-values = [
-    priority_percent.get(low_cluster, 0),
-    priority_percent.get(medium_cluster, 0),
-    priority_percent.get(high_cluster, 0)
-]
-
-fig, ax = plt.subplots()
-ax.bar(labels, values, color=["green", "orange", "red"])
-ax.set_ylabel("Percentage (%)")
-ax.set_title(f"Policy Priority Distribution in {state}")
-st.pyplot(fig)
+st.image(state_chart("infra", state))
 
 # ===============================
 # FOOTER
@@ -0,0 +1,76 @@
+import pandas as pd
+import streamlit as st
+
+# Running statistics are updated once per dataset / model version (utils/drift.py)
+from utils.drift import DRIFT_ALERT, DRIFT_WARN, STATUS_ICONS, drift_report
+
+# ===============================
+# PAGE CONFIG
+# ===============================
+st.set_page_config(
+    page_title="Model Drift Monitor",
+    layout="wide"
+)
+
+st.title("📡 Model Drift Monitor")
+st.write(
+    "Compares the running statistics of each clustering model's inputs, updated as every "
+    "month of data is ingested, with the **mean and scale its scaler was fitted on**."
+)
+
+report = drift_report()
+if not report:
+    st.info("No monitored dataset is available yet.")
+    st.stop()
+
+# ===============================
+# SUMMARY
+# ===============================
+st.subheader("📊 Drift by Model")
+
+summary = pd.DataFrame([
+    {
+        "model": name,
+        "status": f"{STATUS_ICONS[r['status']]} {r['status']}",
+        "drift_score": round(r["score"], 3),
+        "latest_month": r["latest_partition"],
+        "latest_month_score": round(r["latest_score"], 3),
+        "occupancy_shift": round(r["occupancy_shift"], 3),
+        "rows": r["rows"],
+        "months": len(r["partitions"]),
+    }
+    for name, r in report.items()
+])
+st.dataframe(summary, hide_index=True)
+st.caption(
+    f"Drift score: worst feature of max(|mean − mean_| / scale_, |log(std / scale_)|). "
+    f"Warn at {DRIFT_WARN}, alert at {DRIFT_ALERT}. Occupancy shift: total variation distance "
+    f"between the latest month's cluster shares and all months."
+)
+
+# ===============================
+# MODEL DETAIL
+# ===============================
+name = st.selectbox("Select Model", list(report))
+r = report[name]
+
+st.subheader(f"🔍 Feature Statistics — {r['scaler']}")
+features = pd.DataFrame(r["features"]).round(3)
+st.dataframe(features, hide_index=True)
+
+st.subheader("📈 Cluster Occupancy by Month (%)")
+if r["occupancy_by_partition"]:
+    occupancy = pd.DataFrame(r["occupancy_by_partition"]).T.mul(100).round(2)
+    occupancy.columns = [f"cluster {c}" for c in occupancy.columns]
+    st.bar_chart(occupancy)
+else:
+    st.info("Occupancy restarts when the clustering model changes; no month has been ingested since.")
+
+# ===============================
+# FOOTER
+# ===============================
+st.markdown("---")
+st.markdown(
+    "📌 **Monitoring:** `python -m tools.drift` ingests new months from the command line; "
+    "`python -m tools.metrics` exports the same scores for Prometheus."
+)
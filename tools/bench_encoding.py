@@ -0,0 +1,114 @@
+"""Benchmark ``utils.encoding.CategoryEncoder`` against the pipeline's LabelEncoders.
+
+    python -m tools.bench_encoding                      # 1M-row columns
+    python -m tools.bench_encoding --rows 5000000 --unseen 0.01 --json enc.json
+
+Columns are sampled from the encoders' own classes (object strings, and the
+same data as a pandas categorical). Codes are checked against
+``LabelEncoder.transform`` before timing; unseen names, which LabelEncoder
+rejects, are timed for CategoryEncoder only.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.encoding import FORECAST_PIPELINE, CategoryEncoder
+from utils.loaders import load_model
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def best_of(repeat, fn):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def bench_column(name, label_encoder, rows, unseen, scalar_calls, repeat, rng):
+    encoder = CategoryEncoder.from_label_encoder(label_encoder)
+    values = label_encoder.classes_[rng.integers(0, len(label_encoder.classes_), rows)].astype(object)
+    categorical = pd.Categorical(values)
+
+    expected = label_encoder.transform(values)
+    if not (np.array_equal(expected, encoder.encode(values))
+            and np.array_equal(expected, encoder.encode(categorical))):
+        raise AssertionError(f"{name}: CategoryEncoder codes differ from LabelEncoder")
+
+    results = {
+        "column": name,
+        "classes": len(encoder),
+        "rows": rows,
+        "label_encoder_s": best_of(repeat, lambda: label_encoder.transform(values)),
+        "encode_object_s": best_of(repeat, lambda: encoder.encode(values)),
+        "encode_categorical_s": best_of(repeat, lambda: encoder.encode(categorical)),
+    }
+
+    # Unseen names: LabelEncoder raises, CategoryEncoder maps them to the fallback
+    with_unseen = values.copy()
+    with_unseen[rng.random(rows) < unseen] = "__unseen__"
+    results["unseen_rows"] = int((with_unseen == "__unseen__").sum())
+    results["encode_unseen_s"] = best_of(repeat, lambda: encoder.encode(with_unseen))
+
+    # Single-value lookups, as page 1 does per prediction
+    sample = values[:scalar_calls]
+    results["scalar_calls"] = len(sample)
+    results["label_encoder_scalar_us"] = best_of(
+        repeat, lambda: [label_encoder.transform([v]) for v in sample]) / len(sample) * 1e6
+    results["encode_one_scalar_us"] = best_of(
+        repeat, lambda: [encoder.encode_one(v) for v in sample]) / len(sample) * 1e6
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark categorical encoding for the forecasting pipeline")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows per column")
+    parser.add_argument("--unseen", type=float, default=0.01, help="Share of unseen names in the fallback run")
+    parser.add_argument("--scalar-calls", type=int, default=2000, help="Single-value lookups to time")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Write the results to this path")
+    args = parser.parse_args(argv)
+
+    os.chdir(ROOT)
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    warnings.filterwarnings("ignore")
+
+    pipeline = load_model(FORECAST_PIPELINE)
+    rng = np.random.default_rng(args.seed)
+
+    results = []
+    for name in ("state", "district"):
+        r = bench_column(name, pipeline[f"{name}_encoder"], args.rows, args.unseen,
+                         args.scalar_calls, args.repeat, rng)
+        results.append(r)
+        print(f"{name} ({r['classes']} classes, {r['rows']:,} rows)")
+        print(f"  LabelEncoder.transform      {r['label_encoder_s'] * 1000:>9.1f} ms")
+        print(f"  encode (object strings)     {r['encode_object_s'] * 1000:>9.1f} ms  "
+              f"{r['label_encoder_s'] / r['encode_object_s']:.1f}x")
+        print(f"  encode (categorical)        {r['encode_categorical_s'] * 1000:>9.1f} ms  "
+              f"{r['label_encoder_s'] / r['encode_categorical_s']:.1f}x")
+        print(f"  encode, {r['unseen_rows']:,} unseen        {r['encode_unseen_s'] * 1000:>9.1f} ms  "
+              f"(LabelEncoder raises)")
+        print(f"  single value: transform([v]) {r['label_encoder_scalar_us']:>8.1f} us, "
+              f"encode_one {r['encode_one_scalar_us']:.2f} us")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
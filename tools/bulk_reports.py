@@ -0,0 +1,222 @@
+"""Headless per-state (and optionally per-district) priority reports, built in parallel.
+
+The parent process loads every model and dataset and scores all districts
+once, then forks a process pool; workers inherit that state copy-on-write,
+so no report reloads or re-scores anything.
+
+    python -m tools.bulk_reports                       # every state, all pages
+    python -m tools.bulk_reports --districts --workers 4 --out reports/
+    python -m tools.bulk_reports --kinds policy --states "Bihar,Kerala"
+
+Each state gets ``<out>/<state>/report.md`` with metrics tables, cluster
+distribution and the recommended actions shown on pages 4-6, plus one PNG
+chart and one district CSV per page. ``--districts`` adds a district table
+and ``<out>/<state>/districts/<district>.md`` per district. Names that map to
+the same directory or file name get a short hash suffix.
+"""
+
+import argparse
+import concurrent.futures
+import hashlib
+import logging
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+from utils.priority import (
+    LEVEL_ICONS, PRIORITY_MODELS, cluster_levels, level_names, recommended_action,
+    state_chart, state_distribution, state_index,
+)
+from utils.warmstart import fork_context
+from utils.warmup import warm_up
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PAGE_TITLES = {
+    "policy": "Data-Driven Policy Support",
+    "infra": "Smart Infrastructure Planning",
+    "citizen": "Citizen Experience Improvement",
+}
+
+
+def slugify(name):
+    return re.sub(r"[^A-Za-z0-9]+", "_", name).strip("_")
+
+
+def unique_slugs(names):
+    """``{name: slug}`` where names that slugify alike ("West Bengal", "West  Bengal")
+    get a short hash of the raw name appended, so no two share a path."""
+    # Compared case-insensitively, as on macOS and Windows file systems
+    groups = {}
+    for name in set(names):
+        groups.setdefault(slugify(name).lower(), []).append(name)
+    slugs = {}
+    for group in groups.values():
+        for name in group:
+            slugs[name] = slugify(name)
+            if len(group) > 1:
+                slugs[name] += "_" + hashlib.sha1(name.encode()).hexdigest()[:6]
+    return slugs
+
+
+def md_table(frame, index=False):
+    frame = frame.reset_index() if index else frame
+    header = "| " + " | ".join(str(c) for c in frame.columns) + " |"
+    rule = "|" + "|".join("---" for _ in frame.columns) + "|"
+    rows = ["| " + " | ".join(str(v) for v in row) + " |" for row in frame.itertuples(index=False)]
+    return "\n".join([header, rule, *rows])
+
+
+# ===============================
+# ONE STATE REPORT (RUNS IN A WORKER)
+# ===============================
+def build_state_report(state, slug, kinds, include_districts, out_dir):
+    started = time.perf_counter()
+    state_dir = Path(out_dir) / slug
+    state_dir.mkdir(parents=True, exist_ok=True)
+    if (state_dir / "districts").exists():
+        for old in (state_dir / "districts").glob("*.md"):
+            old.unlink()
+
+    frames = {kind: state_index(kind).get(state) for kind in kinds}
+    district_slugs = unique_slugs(d for frame in frames.values() if frame is not None for d in frame["district"])
+
+    lines = [f"# {state}", ""]
+    files = set()
+    for kind in kinds:
+        frame = frames[kind]
+        if frame is None:
+            continue
+        spec = PRIORITY_MODELS[kind]
+        names = level_names(kind)
+        mapping = cluster_levels(kind)
+        levels = frame["cluster"].map(mapping)
+
+        lines += [f"## {PAGE_TITLES[kind]}", ""]
+
+        # ----- Metrics -----
+        metrics = frame[spec["features"]].agg(["sum", "mean", "median", "max"]).T.round(1)
+        metrics.index.name = "feature"
+        lines += [f"Rows scored: {len(frame)} ({frame['district'].nunique()} districts)", "",
+                  md_table(metrics, index=True), ""]
+
+        # ----- Cluster distribution -----
+        distribution = state_distribution(kind, state)
+        counts = levels.value_counts()
+        lines += ["| Level | Clusters | Rows | Share (%) |", "|---|---|---|---|"]
+        for level in range(3):
+            clusters = ", ".join(str(c) for c, l in sorted(mapping.items()) if l == level)
+            lines.append(f"| {LEVEL_ICONS[level]} {names[level]} | {clusters} "
+                         f"| {int(counts.get(level, 0))} | {distribution[level]:.1f} |")
+
+        chart = f"{kind}_distribution.png"
+        (state_dir / chart).write_bytes(state_chart(kind, state))
+        files.add(chart)
+        lines += ["", f"![{PAGE_TITLES[kind]} in {state}]({chart})", ""]
+
+        # ----- Recommended actions for the levels present -----
+        lines += ["### Recommended actions", ""]
+        for level in sorted(levels.unique(), reverse=True):
+            _, action = recommended_action(kind, level)
+            lines += [f"**{LEVEL_ICONS[level]} {names[level]}** ({int(counts[level])} rows)", "", action, ""]
+
+        # ----- Per-district table -----
+        districts = frame.drop_duplicates(subset=["district"])[["district", *spec["features"]]].copy()
+        districts["priority"] = [f"{LEVEL_ICONS[l]} {names[l]}" for l in levels.loc[districts.index]]
+        csv = f"{kind}_districts.csv"
+        districts.to_csv(state_dir / csv, index=False)
+        files.add(csv)
+        if include_districts:
+            lines += ["### Districts", "", md_table(districts.sort_values("district")), ""]
+            files.update(write_district_reports(kind, state, state_dir, districts, levels, district_slugs))
+
+    (state_dir / "report.md").write_text("\n".join(lines))
+    files.add("report.md")
+    return {"state": state, "seconds": time.perf_counter() - started, "files": len(files)}
+
+
+def write_district_reports(kind, state, state_dir, districts, levels, slugs):
+    spec = PRIORITY_MODELS[kind]
+    district_dir = state_dir / "districts"
+    district_dir.mkdir(exist_ok=True)
+
+    files = []
+    for idx, row in districts.iterrows():
+        _, action = recommended_action(kind, levels.loc[idx])
+        path = district_dir / f"{slugs[row['district']]}.md"
+        # One file per district; each page appends its own section
+        with open(path, "a") as f:
+            f.write(f"# {row['district']}, {state} — {PAGE_TITLES[kind]}\n\n")
+            for feature in spec["features"]:
+                f.write(f"- {feature}: {row[feature]:,.0f}\n")
+            f.write(f"\n**Priority:** {row['priority']}\n\n{action}\n\n")
+        files.append(str(path.relative_to(state_dir)))
+    return files
+
+
+# ===============================
+# DRIVER
+# ===============================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate priority reports for every state in parallel")
+    parser.add_argument("--kinds", default=",".join(PRIORITY_MODELS),
+                        help="Comma-separated pages to include: policy, infra, citizen")
+    parser.add_argument("--states", help="Comma-separated states (default: every state)")
+    parser.add_argument("--districts", action="store_true", help="Also write a per-district table and one report per district")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Process pool size")
+    parser.add_argument("--out", default="reports", help="Output directory")
+    args = parser.parse_args(argv)
+
+    os.chdir(ROOT)
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+    # Load and score everything once; forked workers inherit it
+    t0 = time.perf_counter()
+    ctx = fork_context()
+    warm_up(top_states=0)
+    kinds = []
+    for kind in args.kinds.split(","):
+        try:
+            state_index(kind)
+            kinds.append(kind)
+        except FileNotFoundError as e:
+            print(f"Skipping {kind}: missing {e.filename}")
+    load_seconds = time.perf_counter() - t0
+
+    all_states = sorted({s for kind in kinds for s in state_index(kind)})
+    # Slugs over every state, so a --states subset writes to the same directories
+    state_slugs = unique_slugs(all_states)
+    if args.states:
+        wanted = [s.strip() for s in args.states.split(",")]
+        all_states = [s for s in all_states if s in wanted]
+
+    print(f"Loaded models and data in {load_seconds:.2f}s; "
+          f"building {len(all_states)} reports with {args.workers} workers")
+
+    started = time.perf_counter()
+    results, failures = [], []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=args.workers, mp_context=ctx) as pool:
+        futures = {
+            pool.submit(build_state_report, state, state_slugs[state], kinds, args.districts, args.out): state
+            for state in all_states
+        }
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                failures.append((futures[future], e))
+    wall = time.perf_counter() - started
+
+    for state, error in failures:
+        print(f"FAILED {state}: {type(error).__name__}: {error}")
+    per_report = sum(r["seconds"] for r in results) / len(results) if results else 0.0
+    print(f"{len(results)} reports ({sum(r['files'] for r in results)} files) in {wall:.2f}s wall "
+          f"({len(results) / wall if wall else 0:.1f} reports/s, {per_report * 1000:.0f} ms per report in-worker) "
+          f"-> {args.out}/")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
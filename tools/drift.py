@@ -0,0 +1,59 @@
+"""Ingest new month partitions into the drift statistics and print drift per model.
+
+    python -m tools.drift
+    python -m tools.drift --fail-on alert --json drift.json
+    python -m tools.drift --reset          # drop the persisted state first
+
+Only partitions missing from ``monitoring/drift_state.json`` are read.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+
+from utils.drift import DRIFT_STATE, STATUS_ICONS, report, update
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Update and report model input drift")
+    parser.add_argument("--state", default=DRIFT_STATE, help="Drift state file")
+    parser.add_argument("--reset", action="store_true", help="Rebuild the state from every partition")
+    parser.add_argument("--fail-on", choices=["warn", "alert"], help="Exit 1 when any model reaches this status")
+    parser.add_argument("--json", help="Write the drift report to this path")
+    args = parser.parse_args(argv)
+
+    os.chdir(ROOT)
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+    if args.reset and os.path.exists(args.state):
+        os.remove(args.state)
+    drift = report(update(args.state, log=print))
+
+    print()
+    for name, r in drift.items():
+        print(f"{STATUS_ICONS[r['status']]} {name:<10} score {r['score']:.3f}  "
+              f"latest {r['latest_partition']} {r['latest_score']:.3f}  "
+              f"{r['rows']:,} rows / {len(r['partitions'])} partitions  "
+              f"occupancy shift {r['occupancy_shift']:.3f}")
+        for f in r["features"]:
+            print(f"      {f['feature']:<24} mean {f['mean']:>12,.3f} (fitted {f['fitted_mean']:,.3f})  "
+                  f"std/scale {f['scale_ratio']:.3f}  p50/p95/p99 "
+                  f"{f['p50']:,.3g}/{f['p95']:,.3g}/{f['p99']:,.3g}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(drift, f, indent=2)
+
+    levels = {"warn": ("warn", "alert"), "alert": ("alert",)}
+    if args.fail_on and any(r["status"] in levels[args.fail_on] for r in drift.values()):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
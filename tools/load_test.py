@@ -0,0 +1,366 @@
+"""Local concurrent-session load generator for the SmartAadhaar360 app.
+
+Every simulated session runs in its own worker process and drives the real
+page scripts through Streamlit's headless ``AppTest`` runner, so no server,
+browser or external service is needed.
+
+Example (run from the repository root):
+
+    python -m tools.load_test --sessions 1,2,4,8,16 --duration 20 \
+        --page-mix "4=3,5=2,6=1,1=1" --widget-mix "selectbox=4,button=1"
+"""
+
+import argparse
+import json
+import os
+import queue
+import random
+import resource
+import sys
+import threading
+import time
+import multiprocessing as mp
+from pathlib import Path
+
+from utils.warmstart import fork_context
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# =========================
+# PAGE DISCOVERY
+# =========================
+def discover_pages():
+    pages = {"app": ROOT / "app.py"}
+    for path in sorted((ROOT / "pages").glob("*.py")):
+        number = path.name.split("_", 1)[0]
+        pages[number] = path
+    return pages
+
+
+def parse_mix(text, allowed):
+    mix = {}
+    for part in text.split(","):
+        if not part.strip():
+            continue
+        key, _, weight = part.partition("=")
+        key = key.strip()
+        if key not in allowed:
+            raise ValueError(f"Unknown mix key '{key}', expected one of {sorted(allowed)}")
+        mix[key] = float(weight) if weight else 1.0
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError(f"Mix '{text}' has no positive weights")
+    return mix
+
+
+# =========================
+# WIDGET INTERACTIONS
+# =========================
+WIDGET_TYPES = ("selectbox", "radio", "button", "number_input", "slider")
+
+
+def _interact(at, kind, rng):
+    widgets = [w for w in getattr(at, kind) if not getattr(w, "disabled", False)]
+    if not widgets:
+        return False
+    widget = rng.choice(widgets)
+
+    if kind in ("selectbox", "radio"):
+        if not widget.options:
+            return False
+        # options are display labels; AppTest maps a label back to its option
+        # when format_func raises on it, so pages look labels up strictly
+        index = rng.randrange(len(widget.options))
+        if kind == "selectbox":
+            widget.select_index(index)
+        else:
+            widget.set_value(widget.options[index])
+    elif kind == "button":
+        widget.click()
+    elif kind == "number_input":
+        widget.increment() if rng.random() < 0.5 else widget.decrement()
+    elif kind == "slider":
+        value = widget.value
+        if isinstance(value, (tuple, list)):
+            return False
+        lo, hi = widget.min, widget.max
+        if isinstance(value, int):
+            widget.set_value(rng.randint(int(lo), int(hi)))
+        else:
+            widget.set_value(rng.uniform(lo, hi))
+    return True
+
+
+def _rss_mb():
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+
+
+# =========================
+# SESSION WORKER
+# =========================
+def session_worker(worker_id, config, barrier, results):
+    # Any imports the parent did not preload happen before the barrier
+    from streamlit.testing.v1 import AppTest
+    from streamlit.logger import set_log_level
+
+    # Page failures are counted below; keep their tracebacks off the report
+    set_log_level("critical")
+    os.chdir(ROOT)
+
+    rng = random.Random(config["seed"] + worker_id)
+    pages = discover_pages()
+    page_keys = list(config["page_mix"])
+    page_weights = [config["page_mix"][k] for k in page_keys]
+    widget_keys = list(config["widget_mix"])
+    widget_weights = [config["widget_mix"][k] for k in widget_keys]
+
+    samples = []
+    errors = {}
+    barrier.wait()
+
+    usage_start = resource.getrusage(resource.RUSAGE_SELF)
+    started = time.perf_counter()
+    deadline = started + config["duration"]
+
+    while time.perf_counter() < deadline:
+        page = rng.choices(page_keys, page_weights)[0]
+        at = AppTest.from_file(str(pages[page]), default_timeout=config["timeout"])
+        steps = [("load", None)] + [
+            ("widget", rng.choices(widget_keys, widget_weights)[0])
+            for _ in range(config["interactions"])
+        ]
+        for action, kind in steps:
+            if time.perf_counter() >= deadline:
+                break
+            t0 = time.perf_counter()
+            try:
+                if action == "widget" and not _interact(at, kind, rng):
+                    continue
+                at.run()
+                ok = not at.exception
+                if not ok:
+                    reason = at.exception[0].message.splitlines()[0][:120]
+                    errors[f"{page}: {reason}"] = errors.get(f"{page}: {reason}", 0) + 1
+            except Exception as e:
+                ok = False
+                reason = f"{page}: {type(e).__name__}: {str(e)[:120]}"
+                errors[reason] = errors.get(reason, 0) + 1
+            samples.append((page, kind or action, time.perf_counter() - t0, ok))
+            if config["think_time"]:
+                time.sleep(rng.expovariate(1 / config["think_time"]))
+            if not ok:
+                break
+
+    wall = time.perf_counter() - started
+    usage_end = resource.getrusage(resource.RUSAGE_SELF)
+    cpu = (usage_end.ru_utime - usage_start.ru_utime) + (usage_end.ru_stime - usage_start.ru_stime)
+
+    results.put({
+        "worker": worker_id,
+        "wall": wall,
+        "cpu_seconds": cpu,
+        "rss_mb": _rss_mb(),
+        "peak_rss_mb": usage_end.ru_maxrss / 1024,
+        "samples": samples,
+        "errors": errors,
+    })
+
+
+# =========================
+# LOAD LEVELS
+# =========================
+def percentile(values, q):
+    if not values:
+        return float("nan")
+    values = sorted(values)
+    idx = min(len(values) - 1, max(0, int(round(q / 100 * (len(values) - 1)))))
+    return values[idx]
+
+
+# Seconds a worker gets to import and reach the start barrier
+STARTUP_TIMEOUT = 120.0
+
+
+def _collect_reports(workers, results, deadline):
+    """Reports of the workers that finish before ``deadline``; stops early once the rest have died."""
+    reports = []
+    while len(reports) < len(workers) and time.perf_counter() < deadline:
+        try:
+            reports.append(results.get(timeout=1.0))
+        except queue.Empty:
+            if not any(w.is_alive() for w in workers):
+                break
+    return reports
+
+
+def run_level(sessions, config):
+    ctx = fork_context() if config["preload"] else mp.get_context("fork")
+    barrier = ctx.Barrier(sessions + 1)
+    results = ctx.Queue()
+    workers = [
+        ctx.Process(target=session_worker, args=(i, config, barrier, results))
+        for i in range(sessions)
+    ]
+    for w in workers:
+        w.start()
+    try:
+        barrier.wait(timeout=STARTUP_TIMEOUT)
+    except threading.BrokenBarrierError:
+        # A worker died or hung during startup; the others fail at the barrier too
+        barrier.abort()
+    started = time.perf_counter()
+
+    # Each rerun is bounded by --timeout, so a live worker ends within this
+    deadline = started + config["duration"] + (config["interactions"] + 1) * config["timeout"] + 30
+    reports = _collect_reports(workers, results, deadline)
+    wall = time.perf_counter() - started
+    for w in workers:
+        w.join(timeout=5)
+        if w.is_alive():
+            w.terminate()
+            w.join()
+
+    # Workers that never reported (import error, OOM kill, hang) count as failures
+    reported = {r["worker"] for r in reports}
+    dead = {
+        i: "timed out" if w.exitcode == -15 else f"exited with code {w.exitcode}"
+        for i, w in enumerate(workers) if i not in reported
+    }
+
+    samples = [s for r in reports for s in r["samples"]]
+    latencies = [s[2] for s in samples]
+    errors = {}
+    for r in reports:
+        for reason, count in r["errors"].items():
+            errors[reason] = errors.get(reason, 0) + count
+    for i, reason in dead.items():
+        errors[f"worker {i} {reason} without a report"] = 1
+
+    per_page = {}
+    for page, _, latency, ok in samples:
+        per_page.setdefault(page, []).append(latency)
+
+    return {
+        "sessions": sessions,
+        "wall_seconds": wall,
+        "requests": len(samples),
+        "failed": sum(1 for s in samples if not s[3]) + len(dead),
+        "dead_workers": len(dead),
+        "throughput_rps": len(samples) / wall if wall else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": max(latencies, default=float("nan")) * 1000,
+        "per_page_p95_ms": {p: percentile(v, 95) * 1000 for p, v in sorted(per_page.items())},
+        "workers": [
+            {
+                "worker": r["worker"],
+                "cpu_seconds": r["cpu_seconds"],
+                "cpu_percent": 100 * r["cpu_seconds"] / r["wall"] if r["wall"] else 0.0,
+                "rss_mb": r["rss_mb"],
+                "peak_rss_mb": r["peak_rss_mb"],
+            }
+            for r in sorted(reports, key=lambda r: r["worker"])
+        ],
+        "errors": errors,
+    }
+
+
+def find_saturation(levels, min_gain, p95_budget_ms):
+    """Return the last level before throughput stops scaling or p95 breaks its budget."""
+    for i, level in enumerate(levels):
+        if p95_budget_ms and level["p95_ms"] > p95_budget_ms:
+            return levels[max(i - 1, 0)]
+        if i and level["throughput_rps"] < levels[i - 1]["throughput_rps"] * (1 + min_gain):
+            return levels[i - 1]
+    return None
+
+
+# =========================
+# REPORTING
+# =========================
+def print_level(level):
+    print(
+        f"{level['sessions']:>8} {level['requests']:>9} {level['failed']:>7} "
+        f"{level['throughput_rps']:>9.1f} {level['p50_ms']:>9.0f} {level['p95_ms']:>9.0f} "
+        f"{level['p99_ms']:>9.0f} "
+        f"{sum(w['cpu_percent'] for w in level['workers']) / max(len(level['workers']), 1):>8.0f} "
+        f"{max((w['rss_mb'] for w in level['workers']), default=0):>8.0f}"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", default="1,2,4,8",
+                        help="Comma-separated concurrent session counts to step through")
+    parser.add_argument("--duration", type=float, default=15.0,
+                        help="Seconds to hold each concurrency level")
+    parser.add_argument("--page-mix", default="app=1,1=1,2=1,3=1,4=1,5=1,6=1",
+                        help="Page weights, e.g. '4=3,5=2,app=1'")
+    parser.add_argument("--widget-mix", default="selectbox=4,radio=1,button=1,number_input=1,slider=1",
+                        help=f"Widget interaction weights over {', '.join(WIDGET_TYPES)}")
+    parser.add_argument("--interactions", type=int, default=5,
+                        help="Widget interactions per session after the first page load")
+    parser.add_argument("--think-time", type=float, default=0.0,
+                        help="Mean think time between interactions, in seconds")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-rerun timeout in seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-preload", action="store_true",
+                        help="Fork workers without pre-importing the heavy libraries in the parent")
+    parser.add_argument("--saturation-gain", type=float, default=0.10,
+                        help="Minimum relative throughput gain for the next level to count as scaling")
+    parser.add_argument("--p95-budget-ms", type=float, default=0.0,
+                        help="Treat a level whose p95 exceeds this as saturated (0 disables)")
+    parser.add_argument("--json", help="Write the full report to this path")
+    args = parser.parse_args(argv)
+
+    pages = discover_pages()
+    config = {
+        "duration": args.duration,
+        "page_mix": parse_mix(args.page_mix, pages),
+        "widget_mix": parse_mix(args.widget_mix, WIDGET_TYPES),
+        "interactions": args.interactions,
+        "think_time": args.think_time,
+        "timeout": args.timeout,
+        "seed": args.seed,
+        "preload": not args.no_preload,
+    }
+    session_levels = [int(s) for s in args.sessions.split(",") if s.strip()]
+
+    print(f"Load test on {os.cpu_count()} CPUs | page mix {config['page_mix']} | widget mix {config['widget_mix']}")
+    print(f"{'sessions':>8} {'requests':>9} {'failed':>7} {'req/s':>9} {'p50 ms':>9} "
+          f"{'p95 ms':>9} {'p99 ms':>9} {'cpu %':>8} {'rss MB':>8}")
+
+    levels = []
+    for sessions in session_levels:
+        level = run_level(sessions, config)
+        levels.append(level)
+        print_level(level)
+
+    saturation = find_saturation(levels, args.saturation_gain, args.p95_budget_ms)
+    print()
+    if saturation:
+        print(f"Saturation point: ~{saturation['sessions']} concurrent sessions "
+              f"({saturation['throughput_rps']:.1f} req/s, p95 {saturation['p95_ms']:.0f} ms)")
+    else:
+        print("No saturation reached; try higher --sessions levels")
+
+    errors = {}
+    for level in levels:
+        for reason, count in level["errors"].items():
+            errors[reason] = errors.get(reason, 0) + count
+    if errors:
+        print("\nErrors:")
+        for reason, count in sorted(errors.items(), key=lambda kv: -kv[1]):
+            print(f"  {count:>6}  {reason}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"config": config, "levels": levels,
+                       "saturation_sessions": saturation["sessions"] if saturation else None}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
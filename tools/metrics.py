@@ -0,0 +1,41 @@
+"""Print (or write) every registered metric in Prometheus text format.
+
+Cache counters are per process, so this command only sees its own lookups and
+the shared disk tier; ``python -m tools.serve --metrics-file`` exports a
+running server's numbers.
+
+    python -m tools.metrics
+    python -m tools.metrics --out /var/lib/node_exporter/textfile/smartaadhaar.prom
+"""
+
+import argparse
+import logging
+import os
+import sys
+from pathlib import Path
+
+import utils.cache  # noqa: F401  (registers the cache collector)
+import utils.drift  # noqa: F401  (registers the drift collector)
+from utils.metrics import prometheus_text, write_textfile
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export SmartAadhaar360 metrics")
+    parser.add_argument("--out", help="Write to this file (atomically) instead of stdout")
+    args = parser.parse_args(argv)
+
+    out = os.path.abspath(args.out) if args.out else None
+    os.chdir(ROOT)
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+    if out:
+        write_textfile(out)
+    else:
+        sys.stdout.write(prometheus_text())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""Inspect, register and roll back model versions in models/manifest.json.
+
+    python -m tools.models list
+    python -m tools.models register              # hash + describe every artifact
+    python -m tools.models rollback infra_kmeans_model.pkl 1a2b3c4d5e6f
+
+Rolling back copies the archived version over the live file with an atomic
+rename; running servers pick it up through the registry watcher.
+"""
+
+import argparse
+import os
+import shutil
+import sys
+from pathlib import Path
+
+from utils.loaders import MODEL_FILES
+from utils.registry import ModelRegistry
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def cmd_register(registry, args):
+    for filename in MODEL_FILES:
+        info = registry.info(filename)
+        labels = ", ".join(f"{c}={l}" for c, l in info.get("cluster_labels", {}).items())
+        print(f"{filename:<42} {registry.version(filename)}  {info['type']:<16} {labels}")
+    return 0
+
+
+def cmd_list(registry, args):
+    for filename, record in sorted(registry.manifest()["models"].items()):
+        print(filename)
+        for version, info in sorted(record["versions"].items(), key=lambda kv: kv[1]["registered_at"]):
+            marker = "*" if version == record["current"] else " "
+            archived = os.path.exists(os.path.join(registry.models_dir, info.get("artifact", "")))
+            print(f"  {marker} {version}  {info['registered_at']}  {info['bytes']:>9,} B"
+                  f"{'' if archived else '  (archive missing)'}")
+    return 0
+
+
+def cmd_rollback(registry, args):
+    record = registry.manifest()["models"].get(args.name)
+    if record is None or args.version not in record["versions"]:
+        print(f"Unknown version {args.version} of {args.name}", file=sys.stderr)
+        return 1
+    archive = os.path.join(registry.models_dir, record["versions"][args.version].get("artifact", ""))
+    if not os.path.isfile(archive):
+        # models/versions/ is not committed; only versions registered on this machine are archived
+        print(f"Cannot roll back {args.name} to {args.version}: archive missing ({archive})", file=sys.stderr)
+        return 1
+    target = os.path.join(registry.models_dir, args.name)
+    tmp = f"{target}.rollback.tmp"
+    shutil.copy2(archive, tmp)
+    os.replace(tmp, target)
+    print(f"{args.name} -> {args.version}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage versioned model artifacts")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="Show every recorded version; * marks the active one")
+    sub.add_parser("register", help="Hash, archive and describe the artifacts in models/")
+    rollback = sub.add_parser("rollback", help="Make an archived version live again")
+    rollback.add_argument("name")
+    rollback.add_argument("version")
+    args = parser.parse_args(argv)
+
+    os.chdir(ROOT)
+    registry = ModelRegistry(watch_interval=0, archive=True)
+    return {"list": cmd_list, "register": cmd_register, "rollback": cmd_rollback}[args.command](registry, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""Start the Streamlit server with the heavy libraries already imported.
+
+The parent process imports streamlit, pandas, scikit-learn, xgboost and
+matplotlib once and warms the model, dataset, scoring and chart caches
+(see ``utils/warmup.py``), then either runs the server itself or forks one
+server per port so every worker starts warm:
+
+    python -m tools.serve                    # single server on 8501
+    python -m tools.serve --workers 4        # servers on 8501..8504
+    python -m tools.serve --metrics-file /var/lib/node_exporter/textfile/smartaadhaar.prom
+
+``--metrics-file`` makes each server rewrite its cache and drift metrics in
+Prometheus text format (one file per port when there are several workers).
+"""
+
+import argparse
+import os
+import signal
+import sys
+import time
+from pathlib import Path
+
+from utils.metrics import start_textfile_exporter
+from utils.warmstart import preload
+from utils.warmup import warm_up
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def metrics_path(path, port, workers):
+    if workers <= 1:
+        return path
+    stem, ext = os.path.splitext(path)
+    return f"{stem}-{port}{ext}"
+
+
+def run_server(port, extra_args, metrics_file=None, metrics_interval=15.0):
+    from streamlit.web import cli
+
+    os.chdir(ROOT)
+    if metrics_file:
+        start_textfile_exporter(metrics_file, metrics_interval)
+    sys.argv = [
+        "streamlit", "run", str(ROOT / "app.py"),
+        "--server.port", str(port),
+        "--server.headless", "true",
+        *extra_args,
+    ]
+    sys.exit(cli.main())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm-start the SmartAadhaar360 server")
+    parser.add_argument("--port", type=int, default=8501, help="First server port")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of forked server processes (one port each)")
+    parser.add_argument("--no-warmup", action="store_true",
+                        help="Skip the cache warm-up and accept traffic immediately")
+    parser.add_argument("--top-states", type=int, default=5,
+                        help="State charts to pre-render per priority page")
+    parser.add_argument("--metrics-file", help="Export Prometheus metrics to this file")
+    parser.add_argument("--metrics-interval", type=float, default=15.0,
+                        help="Seconds between metrics exports")
+    args, extra_args = parser.parse_known_args(argv)
+    metrics_file = os.path.abspath(args.metrics_file) if args.metrics_file else None
+
+    os.chdir(ROOT)
+    t0 = time.perf_counter()
+    timings = preload()
+    print(f"Preloaded {sum(1 for t in timings.values() if t is not None)} modules "
+          f"in {time.perf_counter() - t0:.2f}s", flush=True)
+
+    if not args.no_warmup:
+        t0 = time.perf_counter()
+        report = warm_up(top_states=args.top_states, log=lambda line: print(line, flush=True))
+        warmed = sum(1 for r in report if r["status"] == "ok")
+        print(f"Warmed {warmed}/{len(report)} cache steps in {time.perf_counter() - t0:.2f}s", flush=True)
+
+    def metrics_for(port):
+        return metrics_path(metrics_file, port, args.workers) if metrics_file else None
+
+    if args.workers <= 1:
+        run_server(args.port, extra_args, metrics_for(args.port), args.metrics_interval)
+        return 0
+
+    children = []
+    for i in range(args.workers):
+        pid = os.fork()
+        if pid == 0:
+            run_server(args.port + i, extra_args, metrics_for(args.port + i), args.metrics_interval)
+        children.append(pid)
+        print(f"Worker {i} (pid {pid}) on port {args.port + i}", flush=True)
+
+    def stop(signum, frame):
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    status = 0
+    for pid in children:
+        _, code = os.waitpid(pid, 0)
+        status = status or os.waitstatus_to_exitcode(code)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""Import-time profile and time-to-first-render budget for the app scripts.
+
+Each measurement runs in a fresh interpreter under ``python -X importtime``,
+renders the script once through Streamlit's headless ``AppTest`` runner and
+reports where the startup time went:
+
+    python -m tools.startup_profile                       # app.py against the budget
+    python -m tools.startup_profile --pages --top 10      # every page, cold
+    python -m tools.startup_profile --budget-ms 0         # report only
+
+Exits non-zero when the landing page misses its budget.
+"""
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Cold first render of app.py (interpreter start + imports + one script run).
+# Measured at ~300-350 ms on a 1-vCPU Linux box; the budget leaves headroom
+# but fails as soon as a page-only library leaks into the landing page.
+DEFAULT_BUDGET_MS = 500
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+RENDER_SNIPPET = """
+import json, sys, time
+t0 = time.perf_counter()
+from streamlit.logger import set_log_level
+set_log_level("critical")
+from streamlit.testing.v1 import AppTest
+imported = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=120).run()
+done = time.perf_counter()
+print(json.dumps({
+    "import_s": imported - t0,
+    "render_s": done - imported,
+    "ok": not at.exception,
+    "heavy": sorted(m for m in ("pandas", "joblib", "sklearn", "xgboost", "matplotlib") if m in sys.modules),
+}))
+"""
+
+
+def parse_importtime(stderr):
+    entries = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append({
+                "module": name,
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+                "depth": len(indent) // 2,
+            })
+    return entries
+
+
+def profile_script(script):
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", RENDER_SNIPPET, str(script)],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    wall = time.perf_counter() - started
+    result = {"script": str(Path(script).relative_to(ROOT)), "wall_ms": wall * 1000}
+    try:
+        summary = json.loads(proc.stdout.strip().splitlines()[-1])
+    except (IndexError, ValueError):
+        summary = {"ok": False, "import_s": float("nan"), "render_s": float("nan"), "heavy": []}
+    result.update({
+        "ok": summary["ok"] and proc.returncode == 0,
+        "import_ms": summary["import_s"] * 1000,
+        "render_ms": summary["render_s"] * 1000,
+        "heavy_modules": summary["heavy"],
+        "imports": parse_importtime(proc.stderr),
+    })
+    return result
+
+
+def measure(script, repeat):
+    runs = [profile_script(script) for _ in range(repeat)]
+    best = min(runs, key=lambda r: r["wall_ms"])
+    best["median_wall_ms"] = statistics.median(r["wall_ms"] for r in runs)
+    return best
+
+
+def print_profile(result, top):
+    status = "ok" if result["ok"] else "FAILED"
+    print(f"\n{result['script']}  [{status}]")
+    print(f"  first render (median wall): {result['median_wall_ms']:.0f} ms "
+          f"| streamlit import {result['import_ms']:.0f} ms | script run {result['render_ms']:.0f} ms")
+    print(f"  heavy libraries loaded: {', '.join(result['heavy_modules']) or 'none'}")
+
+    roots = [e for e in result["imports"] if e["depth"] == 0]
+    print("  top-level imports by cumulative time:")
+    for e in sorted(roots, key=lambda e: -e["cumulative_ms"])[:top]:
+        print(f"    {e['cumulative_ms']:>9.1f} ms  {e['module']}")
+    print("  modules by self time:")
+    for e in sorted(result["imports"], key=lambda e: -e["self_ms"])[:top]:
+        print(f"    {e['self_ms']:>9.1f} ms  {e['module']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile startup imports and first-render time")
+    parser.add_argument("--script", default="app.py", help="Script to profile (relative to the repo root)")
+    parser.add_argument("--pages", action="store_true", help="Also profile every page under pages/")
+    parser.add_argument("--repeat", type=int, default=3, help="Cold runs per script; the median is reported")
+    parser.add_argument("--top", type=int, default=10, help="Rows per import table")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="Time-to-first-render budget for --script (0 disables the check)")
+    parser.add_argument("--json", help="Write the raw measurements to this path")
+    args = parser.parse_args(argv)
+
+    scripts = [ROOT / args.script]
+    if args.pages:
+        scripts += sorted((ROOT / "pages").glob("*.py"))
+
+    results = [measure(script, args.repeat) for script in scripts]
+    for result in results:
+        print_profile(result, args.top)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+    landing = results[0]
+    if args.budget_ms:
+        verdict = "within" if landing["median_wall_ms"] <= args.budget_ms else "OVER"
+        print(f"\n{landing['script']}: {landing['median_wall_ms']:.0f} ms, "
+              f"{verdict} the {args.budget_ms:.0f} ms budget")
+        if verdict == "OVER":
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
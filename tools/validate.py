@@ -0,0 +1,60 @@
+"""Run the data-quality gate on every dataset and report what was quarantined.
+
+    python -m tools.validate
+    python -m tools.validate --json quality.json
+
+Quarantined rows are written with their reason codes to
+``datasets/quarantine/<dataset>.<version>-<encoders>.csv`` (once per dataset
+and forecasting-encoder version).
+Exits non-zero when ``--max-quarantined`` is exceeded for any dataset.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+
+from utils.loaders import DATASET_FILES, dataset_exists
+from utils.quality import quality_report
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate the SmartAadhaar360 datasets")
+    parser.add_argument("--max-quarantined", type=float, default=None,
+                        help="Fail if more than this percentage of a dataset is quarantined")
+    parser.add_argument("--json", help="Write the reports to this path")
+    args = parser.parse_args(argv)
+
+    os.chdir(ROOT)
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+    reports, failed = [], False
+    for filename in DATASET_FILES:
+        if not dataset_exists(filename):
+            print(f"{filename}: missing, skipped")
+            continue
+        report = quality_report(filename)
+        reports.append(report)
+
+        share = 100 * report["quarantined_rows"] / report["rows"] if report["rows"] else 0.0
+        print(f"{filename} (version {report['version']}, encoders {report['encoder_version']}): {report['rows']:,} rows, "
+              f"{report['clean_rows']:,} clean, {report['quarantined_rows']:,} quarantined ({share:.1f}%)")
+        for code, count in sorted(report["reasons"].items(), key=lambda item: -item[1]):
+            print(f"    {count:>8,}  {code}")
+        if report["quarantine_file"]:
+            print(f"    -> {report['quarantine_file']}")
+        if args.max_quarantined is not None and share > args.max_quarantined:
+            failed = True
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(reports, f, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
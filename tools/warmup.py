@@ -0,0 +1,51 @@
+"""Warm the model, dataset, scoring and chart caches and report each step.
+
+    python -m tools.warmup --top-states 10
+
+The server entry point (``python -m tools.serve``) runs the same warm-up in
+its own process before it starts listening; this command is for checking
+what gets warmed and how long a cold start costs.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+from utils.warmup import warm_up
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-warm the SmartAadhaar360 caches")
+    parser.add_argument("--top-states", type=int, default=5,
+                        help="State charts to render per priority page")
+    parser.add_argument("--json", help="Write the step report to this path")
+    args = parser.parse_args(argv)
+
+    json_path = os.path.abspath(args.json) if args.json else None
+    os.chdir(ROOT)
+
+    # Caches are used outside a Streamlit run here; silence the bare-mode warnings
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+    started = time.perf_counter()
+    report = warm_up(top_states=args.top_states, log=print)
+    total = time.perf_counter() - started
+
+    counts = {status: sum(1 for r in report if r["status"] == status) for status in ("ok", "skipped", "failed")}
+    print(f"\nWarmed {counts['ok']} steps in {total:.2f}s "
+          f"({counts['skipped']} skipped, {counts['failed']} failed)")
+
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump({"total_seconds": total, "steps": report}, f, indent=2)
+    return 1 if counts["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
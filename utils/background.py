@@ -0,0 +1,111 @@
+"""Compute heavy page sections off the script thread and render them when ready.
+
+A page calls :func:`render_section` for each slow section. The computation is
+submitted to a shared thread pool and the section is drawn as a fragment that
+shows a progress bar and polls until the result is in; the rest of the page
+(sidebar, headline metrics) renders immediately.
+
+Each section remembers the inputs it was started with. When a rerun asks for
+the same section with different inputs (e.g. another state was selected), the
+stale task is cancelled: a queued task never starts, and a running one stops
+at its next :meth:`Task.progress` checkpoint.
+"""
+
+import concurrent.futures
+import os
+import threading
+import time
+
+import streamlit as st
+
+POLL_INTERVAL = float(os.environ.get("SMARTAADHAAR_SECTION_POLL", "0.3"))
+
+_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=max(2, os.cpu_count() or 1), thread_name_prefix="page-section"
+)
+
+_TASKS_KEY = "_background_tasks"
+
+
+class Cancelled(Exception):
+    """Raised inside a worker once its task has been superseded."""
+
+
+class Task:
+    def __init__(self, key):
+        self.key = key
+        self.fraction = 0.0
+        self.text = "Queued…"
+        self.started = time.perf_counter()
+        self.future = None
+        self.shown = False
+        self._cancelled = threading.Event()
+
+    def progress(self, fraction, text=None):
+        """Report progress from the worker; raises :class:`Cancelled` if the task is stale."""
+        if self._cancelled.is_set():
+            raise Cancelled()
+        self.fraction = min(max(fraction, 0.0), 1.0)
+        if text:
+            self.text = text
+
+    def cancel(self):
+        self._cancelled.set()
+        self.future.cancel()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def done(self):
+        return self.future.done()
+
+    def failed(self):
+        return self.done() and not self.future.cancelled() and self.future.exception() is not None
+
+
+def submit(section, key, fn, *args):
+    """Start ``fn(task, *args)`` for this session's section unless it is already
+    running (or finished) for the same ``key``; a task for another key is cancelled.
+
+    A task that failed is retried on the first rerun after its error was shown,
+    so a transient failure (e.g. a dataset being rewritten) does not stick.
+    """
+    tasks = st.session_state.setdefault(_TASKS_KEY, {})
+    task = tasks.get(section)
+    if task is not None and task.key == key and not task.cancelled and not (task.failed() and task.shown):
+        return task
+    if task is not None:
+        task.cancel()
+
+    task = Task(key)
+    task.future = _executor.submit(_run, fn, task, *args)
+    tasks[section] = task
+    return task
+
+
+def _run(fn, task, *args):
+    task.progress(0.0, "Starting…")
+    result = fn(task, *args)
+    task.progress(1.0, "Done")
+    return result
+
+
+def render_section(section, key, fn, args, render, poll=POLL_INTERVAL):
+    """Render ``render(result)`` of ``fn(task, *args)`` as a fragment that fills in when ready."""
+    task = submit(section, key, fn, *args)
+    pending = not task.done()
+
+    def body():
+        current = st.session_state[_TASKS_KEY][section]
+        if not current.done():
+            st.progress(current.fraction, text=f"{current.text} ({time.perf_counter() - current.started:.1f}s)")
+            return
+        if pending:
+            # Finished since the page ran: one full rerun redraws the section
+            # from the stored result and stops this fragment's polling
+            st.rerun()
+        current.shown = True
+        render(current.future.result())
+
+    st.fragment(body, run_every=poll if pending else None)()
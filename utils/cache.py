@@ -0,0 +1,402 @@
+"""Process-wide cache for the app's expensive intermediates.
+
+``@cached`` replaces ``st.cache_resource`` for every cached function in
+``utils/``:
+
+* keys are the SHA-256 of the code version, the function name and its
+  arguments, and the cached functions take the dataset / model versions as
+  arguments, so a new version (or a deploy that changes ``utils/``) is a new key;
+* the memory tier is an LRU bounded by estimated bytes
+  (``SMARTAADHAAR_CACHE_MB``, default 512), with optional per-function TTL
+  and entry limits;
+* functions marked ``disk=True`` also use a SQLite tier (WAL, memory-mapped
+  reads) that survives restarts and is shared by the processes on one host.
+  It is enabled by ``SMARTAADHAAR_CACHE_DISK`` (``1`` for
+  ``.cache/smartaadhaar.sqlite``, or a path) and bounded by
+  ``SMARTAADHAAR_CACHE_DISK_MB`` (default 2048).
+
+Hits, misses, evictions and bytes held are exported through ``utils.metrics``.
+Like ``st.cache_resource``, returned objects are shared: treat them as read-only.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict, defaultdict
+
+import numpy as np
+import pandas as pd
+
+from utils.metrics import Sample, register
+
+MEMORY_BUDGET = int(float(os.environ.get("SMARTAADHAAR_CACHE_MB", "512")) * 2 ** 20)
+DISK_BUDGET = int(float(os.environ.get("SMARTAADHAAR_CACHE_DISK_MB", "2048")) * 2 ** 20)
+DEFAULT_DISK_PATH = os.path.join(".cache", "smartaadhaar.sqlite")
+
+
+def code_version():
+    """Hash of every module in ``utils/`` (the cached functions and the rules they
+    read) and of the pandas / numpy versions their pickles depend on.
+    ``SMARTAADHAAR_RELEASE`` replaces it with a release id."""
+    release = os.environ.get("SMARTAADHAAR_RELEASE")
+    if release:
+        return release
+    digest = hashlib.sha256(f"{pd.__version__} {np.__version__}".encode())
+    package = os.path.dirname(os.path.abspath(__file__))
+    for filename in sorted(os.listdir(package)):
+        if filename.endswith(".py"):
+            with open(os.path.join(package, filename), "rb") as f:
+                digest.update(filename.encode() + b"\0" + f.read())
+    return digest.hexdigest()[:12]
+
+
+# Part of every key: results pickled by an older deploy are never served
+CODE_VERSION = code_version()
+
+
+def _disk_path():
+    setting = os.environ.get("SMARTAADHAAR_CACHE_DISK", "")
+    if setting in ("", "0"):
+        return None
+    return os.path.abspath(DEFAULT_DISK_PATH if setting == "1" else setting)
+
+
+# ===============================
+# SIZE ESTIMATE
+# ===============================
+def sizeof(value, _seen=None):
+    """Approximate bytes held by ``value`` (frames, arrays, containers, plain objects)."""
+    _seen = set() if _seen is None else _seen
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True, index=True).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (bytes, bytearray, str)):
+        return sys.getsizeof(value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sizeof(k, _seen) + sizeof(v, _seen) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(sizeof(v, _seen) for v in value)
+    if hasattr(value, "get_arrays"):  # sklearn KDTree / BallTree
+        return sum(a.nbytes for a in value.get_arrays() if isinstance(a, np.ndarray))
+    if hasattr(value, "__dict__"):
+        return sys.getsizeof(value) + sizeof(vars(value), _seen)
+    return sys.getsizeof(value)
+
+
+# ===============================
+# STATS
+# ===============================
+class Stats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.counts = defaultdict(int)   # (tier, event, function) -> n
+
+    def add(self, tier, event, function, n=1):
+        with self.lock:
+            self.counts[(tier, event, function)] += n
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.counts)
+
+    def total(self, tier, event):
+        return sum(n for (t, e, _), n in self.snapshot().items() if t == tier and e == event)
+
+
+stats = Stats()
+
+
+# ===============================
+# MEMORY TIER
+# ===============================
+class MemoryTier:
+    def __init__(self, budget=MEMORY_BUDGET):
+        self.budget = budget
+        self.lock = threading.RLock()
+        self.entries = OrderedDict()   # key -> (function, value, nbytes, expires)
+        self.bytes = 0
+        self.compute_locks = {}
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return False, None
+            function, value, nbytes, expires = entry
+            if expires is not None and expires <= time.time():
+                self._drop(key)
+                stats.add("memory", "expirations", function)
+                return False, None
+            self.entries.move_to_end(key)
+            return True, value
+
+    def put(self, key, function, value, nbytes, ttl=None, max_entries=None):
+        if nbytes > self.budget:
+            return
+        with self.lock:
+            if key in self.entries:
+                self._drop(key)
+            self.entries[key] = (function, value, nbytes, time.time() + ttl if ttl else None)
+            self.bytes += nbytes
+
+            if max_entries:
+                own = [k for k, e in self.entries.items() if e[0] == function]
+                for old in own[:max(0, len(own) - max_entries)]:
+                    self._drop(old)
+                    stats.add("memory", "evictions", function)
+            while self.bytes > self.budget and self.entries:
+                old, entry = next(iter(self.entries.items()))
+                self._drop(old)
+                stats.add("memory", "evictions", entry[0])
+
+    def _drop(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[2]
+
+    def delete(self, key=None, function=None):
+        with self.lock:
+            if key is not None:
+                self._drop(key)
+            else:
+                for k in [k for k, e in self.entries.items() if e[0] == function]:
+                    self._drop(k)
+
+    def compute_lock(self, key):
+        with self.lock:
+            return self.compute_locks.setdefault(key, threading.Lock())
+
+    def release_compute_lock(self, key):
+        with self.lock:
+            self.compute_locks.pop(key, None)
+
+    def count(self):
+        return len(self.entries)
+
+
+# ===============================
+# DISK TIER (SQLITE)
+# ===============================
+class DiskTier:
+    def __init__(self, path, budget=DISK_BUDGET):
+        self.path = path
+        self.budget = budget
+        self._local = threading.local()
+
+    def _connection(self):
+        # One connection per thread and process; never reuse one across a fork
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY, function TEXT, value BLOB, nbytes INTEGER,"
+                " expires REAL, accessed REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def get(self, key):
+        conn = self._connection()
+        row = conn.execute("SELECT value, expires, function FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return False, None
+        blob, expires, function = row
+        if expires is not None and expires <= time.time():
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            stats.add("disk", "expirations", function)
+            return False, None
+        conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+        return True, pickle.loads(blob)
+
+    def put(self, key, function, value, ttl=None):
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.budget:
+            return
+        conn = self._connection()
+        now = time.time()
+        conn.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+            (key, function, blob, len(blob), now + ttl if ttl else None, now),
+        )
+        self._evict(conn)
+
+    def _evict(self, conn):
+        total = conn.execute("SELECT COALESCE(SUM(nbytes), 0) FROM entries").fetchone()[0]
+        while total > self.budget:
+            row = conn.execute("SELECT key, function, nbytes FROM entries ORDER BY accessed LIMIT 1").fetchone()
+            if row is None:
+                break
+            conn.execute("DELETE FROM entries WHERE key = ?", (row[0],))
+            stats.add("disk", "evictions", row[1])
+            total -= row[2]
+
+    def delete(self, key=None, function=None):
+        conn = self._connection()
+        if key is not None:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        else:
+            conn.execute("DELETE FROM entries WHERE function = ?", (function,))
+
+    def usage(self):
+        return self._connection().execute(
+            "SELECT COUNT(*), COALESCE(SUM(nbytes), 0) FROM entries"
+        ).fetchone()
+
+
+memory = MemoryTier()
+_disk = {}
+
+
+def disk_tier():
+    """The shared SQLite tier, or None when ``SMARTAADHAAR_CACHE_DISK`` is unset."""
+    path = _disk_path()
+    if path is None:
+        return None
+    if path not in _disk:
+        _disk[path] = DiskTier(path)
+    return _disk[path]
+
+
+def _after_fork():
+    # Locks held by other threads at fork time would never be released in the child
+    memory.lock = threading.RLock()
+    memory.compute_locks = {}
+    stats.lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_after_fork)
+
+
+# ===============================
+# DECORATOR
+# ===============================
+def make_key(function, args, kwargs):
+    payload = pickle.dumps((CODE_VERSION, function, args, sorted(kwargs.items())), protocol=4)
+    return hashlib.sha256(payload).hexdigest()
+
+
+def cached(func=None, *, ttl=None, max_entries=None, disk=False):
+    """Cache ``func`` by the content hash of its arguments.
+
+    ``ttl`` (seconds) expires entries, ``max_entries`` bounds this function's
+    memory entries, and ``disk=True`` also stores results in the SQLite tier.
+    ``func.clear(*args)`` drops one entry, ``func.clear()`` all of them.
+    """
+    if func is None:
+        return functools.partial(cached, ttl=ttl, max_entries=max_entries, disk=disk)
+
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = make_key(name, args, kwargs)
+        hit, value = memory.get(key)
+        if hit:
+            stats.add("memory", "hits", name)
+            return value
+
+        try:
+            with memory.compute_lock(key):
+                # Another thread may have filled it while we waited
+                hit, value = memory.get(key)
+                if hit:
+                    stats.add("memory", "hits", name)
+                    return value
+                stats.add("memory", "misses", name)
+
+                tier = disk_tier() if disk else None
+                hit = False
+                if tier is not None:
+                    hit, value = tier.get(key)
+                    stats.add("disk", "hits" if hit else "misses", name)
+                if not hit:
+                    value = func(*args, **kwargs)
+                    if tier is not None:
+                        tier.put(key, name, value, ttl)
+
+                memory.put(key, name, value, sizeof(value), ttl, max_entries)
+                return value
+        finally:
+            memory.release_compute_lock(key)
+
+    def clear(*args, **kwargs):
+        tier = disk_tier() if disk else None
+        if args or kwargs:
+            key = make_key(name, args, kwargs)
+            memory.delete(key=key)
+            if tier is not None:
+                tier.delete(key=key)
+        else:
+            memory.delete(function=name)
+            if tier is not None:
+                tier.delete(function=name)
+
+    wrapper.clear = clear
+    wrapper.cache_name = name
+    return wrapper
+
+
+# ===============================
+# METRICS
+# ===============================
+def summary():
+    """Hit ratio, bytes and evictions per tier."""
+    result = {}
+    tiers = [("memory", memory.count(), memory.bytes)]
+    tier = disk_tier()
+    if tier is not None:
+        entries, nbytes = tier.usage()
+        tiers.append(("disk", entries, nbytes))
+    for name, entries, nbytes in tiers:
+        hits, misses = stats.total(name, "hits"), stats.total(name, "misses")
+        result[name] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+            "entries": entries,
+            "bytes": nbytes,
+            "budget_bytes": memory.budget if name == "memory" else tier.budget,
+            "evictions": stats.total(name, "evictions"),
+            "expirations": stats.total(name, "expirations"),
+        }
+    return result
+
+
+def _collect():
+    samples = []
+    for tier, s in summary().items():
+        labels = {"tier": tier}
+        samples += [
+            Sample("cache_hit_ratio", labels, s["hit_ratio"], "Cache hits over lookups in this process", "gauge"),
+            Sample("cache_bytes", labels, s["bytes"], "Estimated bytes held", "gauge"),
+            Sample("cache_budget_bytes", labels, s["budget_bytes"], "Byte budget before LRU eviction", "gauge"),
+            Sample("cache_entries", labels, s["entries"], "Entries held", "gauge"),
+        ]
+    for (tier, event, function), n in sorted(stats.snapshot().items()):
+        samples.append(Sample(f"cache_{event}_total", {"tier": tier, "function": function}, n,
+                              f"Cache {event} per cached function in this process", "counter"))
+    return samples
+
+
+register("cache", _collect)
@@ -0,0 +1,391 @@
+"""Incremental drift statistics for the clustering models' inputs.
+
+Each dataset is split into month partitions (its ``date`` column). A partition
+is ingested once: its per-feature moments are merged into the running
+Welford/Chan mean and variance, its values are added to a mergeable quantile
+sketch, and its rows are assigned to clusters for the occupancy counts. The
+state is persisted to ``monitoring/drift_state.json``, so a later run reads
+only the partitions it has not seen.
+
+A model's drift score compares the running statistics with its scaler's
+fitted ``mean_`` / ``scale_``. Per feature it is the larger of the mean shift
+in fitted standard deviations and ``|log(std / scale_)|``; per model it is
+the worst feature.
+"""
+
+import json
+import math
+import os
+import time
+from collections import Counter
+from datetime import datetime
+
+import numpy as np
+
+from utils.cache import cached
+from utils.features import (
+    AGE_GROUP_DATASET, AGE_GROUP_MODELS, HOTSPOT_DATASET, HOTSPOT_MODELS, add_age_group_ratios,
+)
+from utils.loaders import dataset_exists, dataset_version, load_model, model_version
+from utils.metrics import Sample, register
+from utils.priority import PRIORITY_MODELS
+from utils.quality import clean_dataset, clean_dataset_version
+
+MONITORING_DIR = "monitoring"
+DRIFT_STATE = os.environ.get("SMARTAADHAAR_DRIFT_STATE", os.path.join(MONITORING_DIR, "drift_state.json"))
+
+# Drift score thresholds (fitted standard deviations / log scale ratio)
+DRIFT_WARN = 0.25
+DRIFT_ALERT = 0.5
+STATUS_ICONS = {"ok": "🟢", "warn": "🟡", "alert": "🔴"}
+
+SKETCH_ACCURACY = 0.01
+
+MONITORS = {
+    "hotspot": {"model": HOTSPOT_MODELS[0], "scaler": HOTSPOT_MODELS[1], "dataset": HOTSPOT_DATASET},
+    "age_group": {
+        "model": AGE_GROUP_MODELS[0],
+        "scaler": AGE_GROUP_MODELS[1],
+        "dataset": AGE_GROUP_DATASET,
+        "derive": add_age_group_ratios,
+    },
+    **{
+        kind: {"model": spec["model"], "scaler": spec["scaler"], "dataset": spec["dataset"]}
+        for kind, spec in PRIORITY_MODELS.items()
+    },
+}
+
+
+# ===============================
+# RUNNING STATISTICS
+# ===============================
+def moments(X):
+    """``{n, mean, m2}`` per column of a 2-D array."""
+    mean = X.mean(axis=0) if len(X) else np.zeros(X.shape[1])
+    return {"n": len(X), "mean": mean.tolist(), "m2": ((X - mean) ** 2).sum(axis=0).tolist()}
+
+
+def merge_moments(a, b):
+    """Chan et al. parallel form of Welford's update: combine two sets of moments."""
+    n = a["n"] + b["n"]
+    if not a["n"] or not b["n"]:
+        return dict(b if b["n"] else a)
+    mean_a, mean_b = np.asarray(a["mean"]), np.asarray(b["mean"])
+    delta = mean_b - mean_a
+    mean = mean_a + delta * b["n"] / n
+    m2 = np.asarray(a["m2"]) + np.asarray(b["m2"]) + delta ** 2 * a["n"] * b["n"] / n
+    return {"n": n, "mean": mean.tolist(), "m2": m2.tolist()}
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch with relative error ``accuracy`` (DDSketch-style log buckets)."""
+
+    def __init__(self, accuracy=SKETCH_ACCURACY, positive=None, negative=None, zeros=0):
+        self.accuracy = accuracy
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.positive = Counter(positive or {})
+        self.negative = Counter(negative or {})
+        self.zeros = zeros
+
+    @property
+    def count(self):
+        return self.zeros + sum(self.positive.values()) + sum(self.negative.values())
+
+    def add(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        self.zeros += int((values == 0).sum())
+        for store, part in ((self.positive, values[values > 0]), (self.negative, -values[values < 0])):
+            if len(part):
+                keys, counts = np.unique(np.ceil(np.log(part) / self._log_gamma).astype(np.int64),
+                                         return_counts=True)
+                store.update(dict(zip(keys.tolist(), counts.tolist())))
+
+    def merge(self, other):
+        self.positive.update(other.positive)
+        self.negative.update(other.negative)
+        self.zeros += other.zeros
+
+    def _value(self, key):
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+    def quantile(self, q):
+        n = self.count
+        if not n:
+            return float("nan")
+        rank = q * (n - 1)
+        seen = 0
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self.zeros
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self.positive))
+
+    def to_dict(self):
+        return {
+            "accuracy": self.accuracy,
+            "zeros": self.zeros,
+            "positive": {str(k): v for k, v in self.positive.items()},
+            "negative": {str(k): v for k, v in self.negative.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            data["accuracy"],
+            {int(k): v for k, v in data["positive"].items()},
+            {int(k): v for k, v in data["negative"].items()},
+            data["zeros"],
+        )
+
+
+# ===============================
+# PARTITIONS & STATE
+# ===============================
+def partition_sort_key(partition):
+    try:
+        return 0, datetime.strptime(partition, "%m-%y"), partition
+    except ValueError:
+        return 1, datetime.min, partition
+
+
+def partitions(filename, df):
+    """``{partition id: rows}``; a dataset without ``date`` is one partition per file version."""
+    if "date" in df.columns:
+        return {str(date): rows for date, rows in df.groupby("date", sort=False)}
+    return {f"v{dataset_version(filename)}": df}
+
+
+def load_state(path=DRIFT_STATE):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_state(state, path=DRIFT_STATE):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+
+
+def _empty_monitor(features):
+    return {
+        "features": features,
+        "model_version": None,
+        "partitions": {},
+        "moments": {"n": 0, "mean": [0.0] * len(features), "m2": [0.0] * len(features)},
+        "sketches": {f: QuantileSketch().to_dict() for f in features},
+        "occupancy": None,
+    }
+
+
+def ingest(monitor_state, spec, filename, df):
+    """Fold every partition of ``df`` not yet in ``monitor_state``; returns the new partition ids."""
+    model = load_model(spec["model"])
+    scaler = load_model(spec["scaler"])
+    features = monitor_state["features"]
+
+    # Cluster occupancy is only comparable within one model version
+    version = model_version(spec["model"])
+    if monitor_state["model_version"] != version:
+        monitor_state["model_version"] = version
+        monitor_state["occupancy"] = [0] * model.n_clusters
+        for partition in monitor_state["partitions"].values():
+            partition["occupancy"] = None
+
+    sketches = {f: QuantileSketch.from_dict(d) for f, d in monitor_state["sketches"].items()}
+    new = []
+    for partition, rows in partitions(filename, df).items():
+        if partition in monitor_state["partitions"]:
+            continue
+        if "derive" in spec:
+            rows = spec["derive"](rows.copy())
+        X = rows[features].to_numpy(dtype=np.float64)
+
+        part_moments = moments(X)
+        monitor_state["moments"] = merge_moments(monitor_state["moments"], part_moments)
+        for j, feature in enumerate(features):
+            sketches[feature].add(X[:, j])
+
+        clusters = model.predict(scaler.transform(rows[features])) if len(rows) else np.array([], dtype=int)
+        occupancy = np.bincount(clusters, minlength=model.n_clusters).tolist()
+        monitor_state["occupancy"] = (np.asarray(monitor_state["occupancy"]) + occupancy).tolist()
+
+        monitor_state["partitions"][partition] = {
+            "rows": len(rows),
+            "ingested_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "moments": part_moments,
+            "occupancy": occupancy,
+        }
+        new.append(partition)
+
+    monitor_state["sketches"] = {f: s.to_dict() for f, s in sketches.items()}
+    return new
+
+
+def update(path=DRIFT_STATE, log=None):
+    """Ingest new partitions of every monitored dataset and persist the state."""
+    state = load_state(path)
+    changed = False
+    for name, spec in MONITORS.items():
+        if not dataset_exists(spec["dataset"]):
+            continue
+        features = list(load_model(spec["scaler"]).feature_names_in_)
+        if state.get(name, {}).get("features") != features:
+            state[name] = _empty_monitor(features)
+
+        t0 = time.perf_counter()
+        new = ingest(state[name], spec, spec["dataset"], clean_dataset(spec["dataset"]))
+        changed = changed or bool(new)
+        if log:
+            log(f"{name}: {len(new)} new partition(s) in {(time.perf_counter() - t0) * 1000:.0f} ms"
+                + (f" ({', '.join(sorted(new, key=partition_sort_key))})" if new else ""))
+    if changed:
+        save_state(state, path)
+    return state
+
+
+# ===============================
+# DRIFT SCORES
+# ===============================
+def status(score):
+    if score >= DRIFT_ALERT:
+        return "alert"
+    if score >= DRIFT_WARN:
+        return "warn"
+    return "ok"
+
+
+def feature_drift(stats, scaler):
+    """Per-feature running mean/std against the scaler's ``mean_`` / ``scale_``."""
+    n = stats["n"]
+    mean = np.asarray(stats["mean"])
+    std = np.sqrt(np.asarray(stats["m2"]) / n) if n else np.zeros_like(mean)
+    mean_shift = np.abs(mean - scaler.mean_) / scaler.scale_
+    scale_ratio = std / scaler.scale_
+    with np.errstate(divide="ignore"):
+        scale_drift = np.abs(np.log(scale_ratio))
+    return mean, std, mean_shift, scale_ratio, np.maximum(mean_shift, scale_drift)
+
+
+def occupancy_shares(counts):
+    counts = np.asarray(counts, dtype=np.float64)
+    return (counts / counts.sum()).tolist() if counts.sum() else counts.tolist()
+
+
+def report(state):
+    """Drift summary per monitored model present in ``state``."""
+    result = {}
+    for name, spec in MONITORS.items():
+        monitor_state = state.get(name)
+        if not monitor_state or not monitor_state["moments"]["n"]:
+            continue
+        scaler = load_model(spec["scaler"])
+        features = monitor_state["features"]
+
+        mean, std, mean_shift, scale_ratio, scores = feature_drift(monitor_state["moments"], scaler)
+        sketches = {f: QuantileSketch.from_dict(d) for f, d in monitor_state["sketches"].items()}
+        ordered = sorted(monitor_state["partitions"], key=partition_sort_key)
+        latest = ordered[-1]
+        latest_scores = feature_drift(monitor_state["partitions"][latest]["moments"], scaler)[-1]
+
+        by_partition = {
+            p: occupancy_shares(monitor_state["partitions"][p]["occupancy"])
+            for p in ordered if monitor_state["partitions"][p]["occupancy"] is not None
+        }
+        cumulative = occupancy_shares(monitor_state["occupancy"])
+        occupancy_shift = (
+            0.5 * float(np.abs(np.asarray(by_partition[latest]) - cumulative).sum()) if latest in by_partition else 0.0
+        )
+
+        score = float(scores.max())
+        result[name] = {
+            "model": spec["model"],
+            "scaler": spec["scaler"],
+            "score": score,
+            "status": status(score),
+            "latest_partition": latest,
+            "latest_score": float(latest_scores.max()),
+            "rows": monitor_state["moments"]["n"],
+            "partitions": ordered,
+            "occupancy": cumulative,
+            "occupancy_by_partition": by_partition,
+            "occupancy_shift": occupancy_shift,
+            "features": [
+                {
+                    "feature": feature,
+                    "fitted_mean": float(scaler.mean_[j]),
+                    "fitted_scale": float(scaler.scale_[j]),
+                    "mean": float(mean[j]),
+                    "std": float(std[j]),
+                    "mean_shift": float(mean_shift[j]),
+                    "scale_ratio": float(scale_ratio[j]),
+                    "score": float(scores[j]),
+                    "p50": sketches[feature].quantile(0.5),
+                    "p95": sketches[feature].quantile(0.95),
+                    "p99": sketches[feature].quantile(0.99),
+                }
+                for j, feature in enumerate(features)
+            ],
+        }
+    return result
+
+
+# ===============================
+# CACHED ENTRY POINT (DASHBOARD, METRICS)
+# ===============================
+def _versions():
+    versions = []
+    for name, spec in MONITORS.items():
+        if dataset_exists(spec["dataset"]):
+            versions.append((name, clean_dataset_version(spec["dataset"]),
+                             model_version(spec["model"]), model_version(spec["scaler"])))
+    return tuple(versions)
+
+
+def drift_report():
+    """:func:`report` after ingesting any new partitions; recomputed when a dataset or model changes."""
+    return _drift_report(_versions())
+
+
+@cached(max_entries=4)
+def _drift_report(versions):
+    return report(update())
+
+
+def _collect():
+    samples = []
+    for name, r in drift_report().items():
+        model = {"model": name}
+        samples += [
+            Sample("model_drift_score", model, r["score"], "Worst feature drift vs the fitted scaler", "gauge"),
+            Sample("model_drift_score_latest", model, r["latest_score"],
+                   "Worst feature drift of the latest month partition", "gauge"),
+            Sample("model_drift_rows", model, r["rows"], "Rows folded into the running statistics", "gauge"),
+            Sample("model_drift_partitions", model, len(r["partitions"]), "Month partitions ingested", "gauge"),
+            Sample("model_cluster_occupancy_shift", model, r["occupancy_shift"],
+                   "Total variation distance of latest-month cluster occupancy vs all months", "gauge"),
+        ]
+        for f in r["features"]:
+            labels = {"model": name, "feature": f["feature"]}
+            samples += [
+                Sample("feature_mean_shift", labels, f["mean_shift"],
+                       "Running mean minus fitted mean_, in fitted scale_ units", "gauge"),
+                Sample("feature_scale_ratio", labels, f["scale_ratio"],
+                       "Running standard deviation over fitted scale_", "gauge"),
+            ]
+    return samples
+
+
+register("drift", _collect)
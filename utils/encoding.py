@@ -0,0 +1,88 @@
+"""Dictionary-backed categorical encoding for the forecasting pipeline.
+
+``CategoryEncoder`` produces the same codes as the pipeline's fitted
+``LabelEncoder`` (the position in ``classes_``) but looks single values up in
+a precomputed dict. Whole columns are factorized into categorical codes in one
+hash pass and only the distinct names go through the dict. Names missing from
+training map to a fallback code instead of raising.
+
+    encoders = forecast_encoders()
+    encoders["district"].encode_one("Pune")          # -> int
+    encoders["district"].encode(df["district"])      # -> int64 array
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from utils.cache import cached
+from utils.loaders import load_model, model_version
+from utils.registry import get_registry
+
+FORECAST_PIPELINE = "aadhaar_demand_forecasting_pipeline.pkl"
+
+# Code given to names the encoder was not trained on
+UNKNOWN_CODE = int(os.environ.get("SMARTAADHAAR_UNKNOWN_CODE", "-1"))
+
+
+class CategoryEncoder:
+    def __init__(self, classes, fallback=UNKNOWN_CODE):
+        self.classes_ = np.asarray(classes)
+        self.fallback = fallback
+        self.codes = {name: code for code, name in enumerate(self.classes_.tolist())}
+
+    @classmethod
+    def from_label_encoder(cls, encoder, fallback=UNKNOWN_CODE):
+        return cls(encoder.classes_, fallback)
+
+    def __len__(self):
+        return len(self.classes_)
+
+    def __contains__(self, name):
+        return name in self.codes
+
+    def encode_one(self, name, fallback=None):
+        return self.codes.get(name, self.fallback if fallback is None else fallback)
+
+    def encode(self, values, fallback=None):
+        """Codes for a column (list, array, Series or Categorical); unseen names get ``fallback``."""
+        fallback = self.fallback if fallback is None else fallback
+        if isinstance(values, (list, tuple)):
+            values = np.asarray(values, dtype=object)
+        positions, uniques = pd.factorize(values)
+
+        # One lookup per distinct name; the extra last slot catches missing values (-1)
+        lut = np.fromiter(
+            (self.codes.get(name, fallback) for name in uniques), dtype=np.int64, count=len(uniques)
+        )
+        return np.append(lut, fallback)[positions]
+
+    def known(self, values):
+        """Boolean mask of the values the encoder was trained on."""
+        return self.encode(values, fallback=-1) != -1
+
+
+# ===============================
+# FORECASTING PIPELINE ENCODERS
+# ===============================
+def forecast_encoders():
+    """``{"state": CategoryEncoder, "district": CategoryEncoder}`` for the active pipeline."""
+    return _forecast_encoders(model_version(FORECAST_PIPELINE))
+
+
+@cached
+def _forecast_encoders(version):
+    pipeline = load_model(FORECAST_PIPELINE)
+    return {
+        "state": CategoryEncoder.from_label_encoder(pipeline["state_encoder"]),
+        "district": CategoryEncoder.from_label_encoder(pipeline["district_encoder"]),
+    }
+
+
+def _on_model_swap(name, old_version, new_version):
+    if name == FORECAST_PIPELINE:
+        _forecast_encoders.clear(old_version)
+
+
+get_registry().subscribe(_on_model_swap)
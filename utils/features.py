@@ -0,0 +1,174 @@
+"""Cached feature engineering and full-dataset clustering for pages 2 and 3.
+
+Like ``utils/priority.py``, entries are keyed by the validated dataset's
+version and the active model and scaler versions, and dropped when the
+registry swaps either artifact.
+
+The ``*_section`` functions build what one page section shows for a filter
+selection. They take a ``task`` (``utils.background.Task``) so they can run
+in the background, report progress and stop early once superseded.
+"""
+
+import numpy as np
+
+from utils.cache import cached
+from utils.encoding import FORECAST_PIPELINE
+from utils.loaders import load_model, model_info, model_version
+from utils.quality import clean_dataset, clean_dataset_version
+from utils.registry import get_registry
+
+HOTSPOT_DATASET = "2_uidai_biometric.xls"
+AGE_GROUP_DATASET = "uidai_biometric.xls"
+
+HOTSPOT_MODELS = ("hotspot_kmeans_model.pkl", "hotspot_scaler.pkl")
+AGE_GROUP_MODELS = ("age_group_kmeans_model.pkl", "age_group_scaler.pkl")
+
+
+def _versions(dataset, models, swapped=None, old_version=None):
+    encoders = old_version if swapped == FORECAST_PIPELINE else None
+    return clean_dataset_version(dataset, encoders), tuple(
+        old_version if f == swapped else model_version(f) for f in models
+    )
+
+
+# =========================
+# REGIONAL HOTSPOTS (PAGE 2)
+# =========================
+def hotspot_frame():
+    return _hotspot_frame(_versions(HOTSPOT_DATASET, HOTSPOT_MODELS))
+
+
+@cached(disk=True)
+def _hotspot_frame(versions):
+    kmeans = load_model("hotspot_kmeans_model.pkl")
+    scaler = load_model("hotspot_scaler.pkl")
+    df = clean_dataset(HOTSPOT_DATASET).copy()
+
+    X_scaled = scaler.transform(df[['total_biometric_updates']])
+    df['cluster'] = kmeans.predict(X_scaled)
+
+    # Low / Medium / High Demand, ranked by cluster centroid (models/manifest.json)
+    labels = {int(c): label for c, label in model_info("hotspot_kmeans_model.pkl")["cluster_labels"].items()}
+    df['hotspot_label'] = df['cluster'].map(labels)
+    return df
+
+
+def hotspot_table_section(task, state, demand):
+    task.progress(0.1, "Clustering biometric updates…")
+    df = hotspot_frame()
+
+    task.progress(0.6, "Filtering…")
+    if state != "All":
+        df = df[df['state'] == state]
+    if demand != "All":
+        df = df[df['hotspot_label'] == demand]
+
+    task.progress(0.8, "Sorting…")
+    return (
+        df[['state', 'district', 'pincode', 'total_biometric_updates', 'hotspot_label']]
+        .sort_values(by='total_biometric_updates', ascending=False)
+    )
+
+
+def hotspot_distribution_section(task, state):
+    task.progress(0.1, "Clustering biometric updates…")
+    df = hotspot_frame()
+
+    task.progress(0.7, "Computing distribution…")
+    if state != "All":
+        df = df[df['state'] == state]
+    dist_counts = df['hotspot_label'].value_counts()
+
+    # Convert counts to percentage
+    return (dist_counts / dist_counts.sum() * 100).round(2)
+
+
+# =========================
+# AGE-GROUP DEMAND (PAGE 3)
+# =========================
+def add_age_group_ratios(df):
+    df['total_biometric_updates'] = df['bio_age_5_17'] + df['bio_age_17_']
+
+    df['age_5_17_ratio'] = df['bio_age_5_17'] / df['total_biometric_updates']
+    df['age_17_plus_ratio'] = df['bio_age_17_'] / df['total_biometric_updates']
+    return df
+
+
+def age_group_frame():
+    return _age_group_frame(_versions(AGE_GROUP_DATASET, AGE_GROUP_MODELS))
+
+
+@cached(disk=True)
+def _age_group_frame(versions):
+    kmeans = load_model("age_group_kmeans_model.pkl")
+    scaler = load_model("age_group_scaler.pkl")
+    # Rows without any biometric update are quarantined (utils/quality.py)
+    df = add_age_group_ratios(clean_dataset(AGE_GROUP_DATASET).copy())
+
+    X_scaled = scaler.transform(df[['age_5_17_ratio', 'age_17_plus_ratio']])
+    df['cluster'] = kmeans.predict(X_scaled)
+
+    df['age_group_category'] = np.select(
+        [df['age_5_17_ratio'] > 0.6, df['age_17_plus_ratio'] > 0.6],
+        ["Child-Dominant Demand (5–17)", "Adult-Dominant Demand (17+)"],
+        default="Balanced Demand",
+    )
+    return df
+
+
+def age_group_selection(task, state, district):
+    task.progress(0.1, "Clustering age-group demand…")
+    df = age_group_frame()
+
+    task.progress(0.6, "Filtering…")
+    df = df[df['state'] == state]
+    if district != "All":
+        df = df[df['district'] == district]
+    return df
+
+
+def age_group_table_section(task, state, district):
+    df = age_group_selection(task, state, district)
+    return df[['state', 'district', 'pincode', 'bio_age_5_17', 'bio_age_17_', 'age_group_category']]
+
+
+def age_group_distribution_section(task, state, district):
+    df = age_group_selection(task, state, district)
+
+    task.progress(0.8, "Computing distribution…")
+    age_counts = df['age_group_category'].value_counts()
+    return (age_counts / age_counts.sum() * 100).round(2)
+
+
+SERVICE_RECOMMENDATIONS = {
+    "Child-Dominant Demand (5–17)": "Deploy school-based enrollment camps & child biometric kits",
+    "Adult-Dominant Demand (17+)": "Increase adult service counters & working-hour availability",
+    "Balanced Demand": "Maintain balanced staffing & infrastructure",
+}
+
+
+def age_group_insights_section(task, state, district):
+    df = age_group_selection(task, state, district)
+
+    task.progress(0.8, "Matching service recommendations…")
+    insights = df[['pincode', 'age_group_category']].copy()
+    insights['service_recommendation'] = insights['age_group_category'].map(SERVICE_RECOMMENDATIONS)
+    return insights
+
+
+# =========================
+# INVALIDATION ON MODEL SWAP
+# =========================
+def _on_model_swap(name, old_version, new_version):
+    for dataset, models, frame in (
+        (HOTSPOT_DATASET, HOTSPOT_MODELS, _hotspot_frame),
+        (AGE_GROUP_DATASET, AGE_GROUP_MODELS, _age_group_frame),
+    ):
+        if name in models or name == FORECAST_PIPELINE:
+            try:
+                frame.clear(_versions(dataset, models, name, old_version))
+            except FileNotFoundError:
+                pass
+
+
+get_registry().subscribe(_on_model_swap)
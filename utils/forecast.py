@@ -0,0 +1,37 @@
+"""Cached demand forecasts for page 1.
+
+Each forecast is keyed by the pipeline version and the exact inputs, so
+repeated predictions (the same district and month from many sessions) are a
+cache hit; a swapped pipeline gets fresh keys.
+"""
+
+import numpy as np
+
+from utils.cache import cached
+from utils.encoding import FORECAST_PIPELINE, forecast_encoders
+from utils.loaders import load_model, model_version
+
+FORECAST_TTL = 3600
+
+
+def forecast_demand(state, district, pincode, bio_5_17, bio_17_plus, enrolment_count, month, year):
+    return _forecast_demand(
+        model_version(FORECAST_PIPELINE), state, district, int(pincode),
+        int(bio_5_17), int(bio_17_plus), int(enrolment_count), int(month), int(year),
+    )
+
+
+@cached(ttl=FORECAST_TTL, max_entries=1000)
+def _forecast_demand(version, state, district, pincode, bio_5_17, bio_17_plus, enrolment_count, month, year):
+    encoders = forecast_encoders()
+    X = np.array([[
+        encoders["state"].encode_one(state),
+        encoders["district"].encode_one(district),
+        pincode,
+        bio_5_17,
+        bio_17_plus,
+        enrolment_count,
+        month,
+        year
+    ]])
+    return float(load_model(FORECAST_PIPELINE)["model"].predict(X)[0])
@@ -0,0 +1,79 @@
+"""Process-wide cached access to the pickled models and the CSV datasets.
+
+Everything returned here is shared between sessions: treat it as read-only
+and ``.copy()`` before adding columns. Datasets are cached per file version. Models come from the versioned
+registry in ``utils/registry.py`` and may be swapped while the server runs.
+"""
+
+import os
+
+import pandas as pd
+
+from utils.cache import cached
+from utils.registry import file_sha256, get_registry
+
+DATASETS_DIR = "datasets"
+
+# Artifacts referenced by the six pages
+MODEL_FILES = (
+    "aadhaar_demand_forecasting_pipeline.pkl",
+    "hotspot_kmeans_model.pkl",
+    "hotspot_scaler.pkl",
+    "age_group_kmeans_model.pkl",
+    "age_group_scaler.pkl",
+    "policy_kmeans_model.pkl",
+    "policy_scaler.pkl",
+    "infra_kmeans_model.pkl",
+    "infra_scaler.pkl",
+    "citizen_kmeans_model.pkl",
+    "citizen_scaler.pkl",
+)
+
+DATASET_FILES = (
+    "2_uidai_biometric.xls",
+    "uidai_biometric.xls",
+    "biometric_demographic_merge.xls",
+    "biometric_enrolment_merge.xls",
+)
+
+
+def dataset_path(filename):
+    return os.path.join(DATASETS_DIR, filename)
+
+
+def dataset_exists(filename):
+    return os.path.exists(dataset_path(filename))
+
+
+def load_model(filename):
+    """Active version of ``models/<filename>`` from the hot-reloading registry."""
+    return get_registry().get(filename)
+
+
+def model_version(filename):
+    return get_registry().version(filename)
+
+
+def model_info(filename):
+    """Manifest entry (hash, features, cluster labels) of the active version."""
+    return get_registry().info(filename)
+
+
+def load_dataset(filename):
+    return _load_dataset(filename, dataset_version(filename))
+
+
+@cached
+def _load_dataset(filename, version):
+    return pd.read_csv(dataset_path(filename))
+
+
+def dataset_version(filename):
+    """First 12 hex digits of the dataset's SHA-256; changes whenever the file does."""
+    stat = os.stat(dataset_path(filename))
+    return _dataset_version(filename, stat.st_size, stat.st_mtime_ns)
+
+
+@cached
+def _dataset_version(filename, size, mtime_ns):
+    return file_sha256(dataset_path(filename))[:12]
@@ -0,0 +1,83 @@
+"""Minimal Prometheus text-format export for the app's operational metrics.
+
+Modules register a collector that returns samples; ``python -m tools.metrics``
+(or :func:`prometheus_text`) renders every registered collector.
+
+    register("drift", collect)   # collect() -> [Sample(...), ...]
+"""
+
+import math
+import os
+import threading
+import time
+from collections import namedtuple
+
+PREFIX = "smartaadhaar_"
+
+# kind is "gauge" or "counter"; labels is a dict
+Sample = namedtuple("Sample", "name labels value help kind")
+
+_collectors = {}
+
+
+def register(name, collect):
+    _collectors[name] = collect
+
+
+def collect():
+    samples = []
+    for collect_fn in _collectors.values():
+        samples.extend(collect_fn())
+    return samples
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for v in labels.values())
+    return "{" + ",".join(f'{k}="{v}"' for k, v in zip(labels, escaped)) + "}"
+
+
+def _value(value):
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+def prometheus_text(samples=None):
+    samples = collect() if samples is None else samples
+    lines, described = [], set()
+    # Samples of one metric must be contiguous
+    for s in sorted(samples, key=lambda s: s.name):
+        name = PREFIX + s.name
+        if name not in described:
+            described.add(name)
+            lines += [f"# HELP {name} {s.help}", f"# TYPE {name} {s.kind}"]
+        lines.append(f"{name}{_labels(s.labels)} {_value(s.value)}")
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(path, samples=None):
+    """Write atomically, for node_exporter's textfile collector."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(prometheus_text(samples))
+    os.replace(tmp, path)
+
+
+def start_textfile_exporter(path, interval=15.0):
+    """Rewrite ``path`` every ``interval`` seconds from a daemon thread."""
+    def loop():
+        while True:
+            try:
+                write_textfile(path)
+            except Exception as e:
+                print(f"metrics export to {path} failed: {type(e).__name__}: {e}", flush=True)
+            time.sleep(interval)
+
+    thread = threading.Thread(target=loop, name="metrics-exporter", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,84 @@
+"""Similar-district lookup from a prebuilt KD-tree over a model's scaled features.
+
+One tree is built per (feature space, validated dataset version, model
+versions) and shared by every session, so a query is a single ``tree.query`` call instead
+of a scan over all districts.
+"""
+
+import numpy as np
+
+from utils.cache import cached
+from utils.lazy import lazy_import
+from utils.encoding import FORECAST_PIPELINE
+from utils.loaders import load_model
+from utils.priority import PRIORITY_MODELS, cache_versions
+from utils.quality import clean_dataset
+from utils.registry import get_registry
+
+sk_neighbors = lazy_import("sklearn.neighbors")
+
+# Feature spaces offered in the "Similar Districts" panel
+SPACES = {
+    "policy": "Policy features",
+    "infra": "Infrastructure features",
+}
+
+
+def neighbour_index(kind):
+    return _neighbour_index(kind, cache_versions(kind))
+
+
+@cached
+def _neighbour_index(kind, versions):
+    spec = PRIORITY_MODELS[kind]
+    scaler = load_model(spec["scaler"])
+
+    # One point per district: the same (first) row the pages display
+    frame = (
+        clean_dataset(spec["dataset"])
+        .drop_duplicates(subset=["state", "district"])
+        .reset_index(drop=True)
+    )
+    points = np.ascontiguousarray(scaler.transform(frame[spec["features"]]), dtype=np.float64)
+
+    return {
+        "tree": sk_neighbors.KDTree(points, leaf_size=40),
+        "points": points,
+        "frame": frame[["state", "district"] + spec["features"]],
+        "position": {key: i for i, key in enumerate(zip(frame["state"], frame["district"]))},
+    }
+
+
+def similar_districts(kind, state, district, k=5):
+    """The ``k`` districts nearest to (state, district), or None if it is not indexed."""
+    index = neighbour_index(kind)
+    pos = index["position"].get((state, district))
+    if pos is None:
+        return None
+
+    query_k = min(k + 1, len(index["points"]))
+    distance, neighbours = index["tree"].query(index["points"][pos:pos + 1], k=query_k)
+    distance, neighbours = distance[0], neighbours[0]
+    # Ties at distance 0 can push the district itself out of the k + 1 results
+    keep = neighbours != pos
+    neighbours, distance = neighbours[keep][:k], distance[keep][:k]
+
+    result = index["frame"].iloc[neighbours].copy()
+    result.insert(0, "similarity_distance", distance.round(3))
+    return result.reset_index(drop=True)
+
+
+# ===============================
+# INVALIDATION ON MODEL SWAP
+# ===============================
+def _on_model_swap(name, old_version, new_version):
+    for kind in SPACES:
+        spec = PRIORITY_MODELS[kind]
+        if name in (spec["model"], spec["scaler"], FORECAST_PIPELINE):
+            try:
+                _neighbour_index.clear(kind, cache_versions(kind, name, old_version))
+            except FileNotFoundError:
+                pass
+
+
+get_registry().subscribe(_on_model_swap)
@@ -0,0 +1,211 @@
+"""Shared scoring for the three priority pages (policy, infrastructure, citizen).
+
+Each model scores its whole dataset once; pages then read the selected
+district's cluster, the per-state distribution and the rendered state chart
+from the process-wide cache instead of re-running the model on every rerun.
+
+Cached entries are keyed by the validated dataset's version and the active
+model and scaler versions, so a model swapped in by the registry is picked up
+on the next rerun and only the entries of the affected page are dropped.
+"""
+
+import io
+
+from utils.cache import cached
+from utils.lazy import lazy_import
+from utils.encoding import FORECAST_PIPELINE
+from utils.loaders import load_dataset, load_model, model_info, model_version
+from utils.quality import clean_dataset, clean_dataset_version
+from utils.registry import get_registry
+
+# Only chart rendering needs matplotlib; import it when the first chart is drawn
+mpl_figure = lazy_import("matplotlib.figure")
+
+LEVEL_ICONS = ("🟢", "🟡", "🔴")
+
+# Level names and the cluster -> level mapping live in models/manifest.json
+PRIORITY_MODELS = {
+    "policy": {
+        "model": "policy_kmeans_model.pkl",
+        "scaler": "policy_scaler.pkl",
+        "dataset": "biometric_demographic_merge.xls",
+        "features": ["bio_age_5_17", "bio_age_17_", "total_population", "age_group_population"],
+        "chart_colors": None,
+        "chart_title": "Policy Priority Distribution in {state}",
+        # Recommended action per level (low, medium, high): (alert style, markdown)
+        "actions": (
+            ("info", "**Infrastructure Sufficient**\n"
+                     "- Continue monitoring demand\n"
+                     "- Maintain current service capacity"),
+            ("warning", "**Moderate Policy Attention Needed**\n"
+                        "- Improve existing Aadhaar centers\n"
+                        "- Awareness campaigns for enrollment"),
+            ("error", "**Immediate Action Required**\n"
+                      "- Deploy mobile Aadhaar enrollment units\n"
+                      "- Increase biometric operators & devices\n"
+                      "- Conduct school & rural enrollment drives"),
+        ),
+    },
+    "infra": {
+        "model": "infra_kmeans_model.pkl",
+        "scaler": "infra_scaler.pkl",
+        "dataset": "biometric_enrolment_merge.xls",
+        "features": ["bio_age_5_17", "bio_age_17_", "enrolment_count"],
+        "chart_colors": ["green", "orange", "red"],
+        "chart_title": "Policy Priority Distribution in {state}",
+        "actions": (
+            ("info", "**Low Priority**\n"
+                     "- Maintain current infrastructure\n"
+                     "- Monitor growth in enrollments"),
+            ("warning", "**Moderate Policy Attention Needed**\n"
+                        "- Optimize existing enrollment centers\n"
+                        "- Plan for expansion in near future"),
+            ("error", "**Immediate Action Required**\n"
+                      "- Deploy additional enrollment centers / mobile units\n"
+                      "- Increase operators and devices\n"
+                      "- Conduct awareness campaigns in schools and rural areas"),
+        ),
+    },
+    "citizen": {
+        "model": "citizen_kmeans_model.pkl",
+        "scaler": "citizen_scaler.pkl",
+        "dataset": "2_uidai_biometric.xls",
+        "features": ["total_biometric_updates"],
+        "chart_colors": ["green", "orange", "red"],
+        "chart_title": "Citizen Experience Improvement Distribution in {state}",
+        "actions": (
+            ("info", "- Maintain current infrastructure\n"
+                     "- Regular monitoring is sufficient"),
+            ("warning", "- Optimize existing centers\n"
+                        "- Monitor biometric update trends\n"
+                        "- Plan for future infrastructure scaling"),
+            ("error", "- Deploy more counters or mobile units in this district/pincode\n"
+                      "- Increase staff and operational hours\n"
+                      "- Reduce waiting time for citizens\n"
+                      "- Conduct awareness campaigns"),
+        ),
+    },
+}
+
+
+def cache_versions(kind, swapped=None, old_version=None):
+    """Cache key of a page's scored data: validated dataset, model and scaler versions.
+
+    ``swapped`` / ``old_version`` rebuild the key an entry had before a registry swap.
+    """
+    spec = PRIORITY_MODELS[kind]
+    model, scaler = (old_version if f == swapped else model_version(f) for f in (spec["model"], spec["scaler"]))
+    encoders = old_version if swapped == FORECAST_PIPELINE else None
+    return clean_dataset_version(spec["dataset"], encoders), model, scaler
+
+
+def level_names(kind):
+    return model_info(PRIORITY_MODELS[kind]["model"])["levels"]
+
+
+def cluster_levels(kind):
+    """Map each cluster id to 0 (low), 1 (medium) or 2 (high)."""
+    mapping = model_info(PRIORITY_MODELS[kind]["model"])["cluster_levels"]
+    return {int(c): level for c, level in mapping.items()}
+
+
+def recommended_action(kind, level):
+    """``(alert style, markdown)`` for a level; style is st.info / warning / error."""
+    return PRIORITY_MODELS[kind]["actions"][level]
+
+
+def level_label(kind, cluster):
+    level = cluster_levels(kind)[int(cluster)]
+    return f"{LEVEL_ICONS[level]} {level_names(kind)[level]}"
+
+
+# ===============================
+# FULL-DATASET SCORING
+# ===============================
+def prepared_data(kind):
+    return _prepared_data(kind, cache_versions(kind))
+
+
+@cached(disk=True)
+def _prepared_data(kind, versions):
+    spec = PRIORITY_MODELS[kind]
+    model = load_model(spec["model"])
+    scaler = load_model(spec["scaler"])
+
+    df = clean_dataset(spec["dataset"]).copy()
+    df["cluster"] = model.predict(scaler.transform(df[spec["features"]]))
+    return df
+
+
+# ===============================
+# STATE INDEX & AGGREGATES
+# ===============================
+def state_index(kind):
+    return _state_index(kind, cache_versions(kind))
+
+
+@cached
+def _state_index(kind, versions):
+    return {state: frame for state, frame in _prepared_data(kind, versions).groupby("state")}
+
+
+def states(kind):
+    return sorted(state_index(kind))
+
+
+def state_distribution(kind, state):
+    """Percentage of the state's rows at each level, ordered low/medium/high."""
+    return _state_distribution(kind, state, cache_versions(kind))
+
+
+@cached
+def _state_distribution(kind, state, versions):
+    levels = _state_index(kind, versions)[state]["cluster"].map(cluster_levels(kind))
+    percent = levels.value_counts(normalize=True).mul(100)
+    return [float(percent.get(level, 0)) for level in range(3)]
+
+
+def state_chart(kind, state):
+    """Bar chart of :func:`state_distribution` rendered to PNG bytes."""
+    return _state_chart(kind, state, cache_versions(kind))
+
+
+@cached(disk=True)
+def _state_chart(kind, state, versions):
+    spec = PRIORITY_MODELS[kind]
+
+    fig = mpl_figure.Figure()
+    ax = fig.subplots()
+    values = _state_distribution(kind, state, versions)
+    if spec["chart_colors"]:
+        ax.bar(list(level_names(kind)), values, color=spec["chart_colors"])
+    else:
+        ax.bar(list(level_names(kind)), values)
+    ax.set_ylabel("Percentage (%)")
+    ax.set_title(spec["chart_title"].format(state=state))
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", bbox_inches="tight")
+    return buf.getvalue()
+
+
+# ===============================
+# INVALIDATION ON MODEL SWAP
+# ===============================
+def _on_model_swap(name, old_version, new_version):
+    for kind, spec in PRIORITY_MODELS.items():
+        if name not in (spec["model"], spec["scaler"], FORECAST_PIPELINE):
+            continue
+        try:
+            old = cache_versions(kind, name, old_version)
+            state_names = load_dataset(spec["dataset"])["state"].unique()
+        except FileNotFoundError:
+            continue
+        for state in state_names:
+            _state_chart.clear(kind, state, old)
+            _state_distribution.clear(kind, state, old)
+        _state_index.clear(kind, old)
+        _prepared_data.clear(kind, old)
+
+
+get_registry().subscribe(_on_model_swap)
@@ -0,0 +1,175 @@
+"""Data-quality gate run once per dataset version before any page sees the data.
+
+A single vectorized pass flags null values, negative counts, out-of-range
+pincodes, states and districts the forecasting encoders do not know, and
+repeated (date, state, district[, pincode]) keys. Flagged rows are written
+with their reason codes to ``datasets/quarantine/<dataset>.<version>-<encoders>.csv``;
+pages read the clean frame from :func:`clean_dataset` and never re-filter.
+"""
+
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from utils.cache import cached
+from utils.encoding import FORECAST_PIPELINE, forecast_encoders
+from utils.loaders import DATASETS_DIR, dataset_version, load_dataset, model_version
+from utils.registry import get_registry
+
+QUARANTINE_DIR = os.path.join(DATASETS_DIR, "quarantine")
+
+PINCODE_RANGE = (100000, 999999)
+
+# Reason codes written to the quarantine file (null / negative carry the column)
+NULL_VALUE = "null_value"
+NEGATIVE_COUNT = "negative_count"
+PINCODE_OUT_OF_RANGE = "pincode_out_of_range"
+UNKNOWN_STATE = "unknown_state"
+UNKNOWN_DISTRICT = "unknown_district"
+DUPLICATE_KEY = "duplicate_key"
+NO_UPDATES = "no_updates"
+
+# key: columns identifying one record (only those present are used)
+# counts: non-negative numeric columns the pages feed to the models
+# require_updates: rows whose counts are all zero carry no signal for the page
+DATASET_RULES = {
+    "2_uidai_biometric.xls": {
+        "key": ["date", "state", "district", "pincode"],
+        "counts": ["total_biometric_updates"],
+    },
+    "uidai_biometric.xls": {
+        "key": ["date", "state", "district", "pincode"],
+        "counts": ["bio_age_5_17", "bio_age_17_"],
+        "require_updates": True,
+    },
+    "biometric_demographic_merge.xls": {
+        "key": ["date", "state", "district"],
+        "counts": ["bio_age_5_17", "bio_age_17_", "total_population", "age_group_population"],
+    },
+    "biometric_enrolment_merge.xls": {
+        "key": ["date", "state", "district"],
+        "counts": ["bio_age_5_17", "bio_age_17_", "enrolment_count"],
+    },
+}
+
+
+# ===============================
+# CHECKS
+# ===============================
+def row_flags(df, rules, encoders):
+    """Boolean frame with one column per reason code, one row per input row.
+
+    ``encoders`` maps "state" / "district" to ``utils.encoding.CategoryEncoder``.
+    """
+    key = [c for c in rules["key"] if c in df.columns]
+    counts = rules["counts"]
+    flags = {}
+
+    required = list(dict.fromkeys(key + counts))
+    nulls = df[required].isna()
+    for column in required:
+        flags[f"{NULL_VALUE}:{column}"] = nulls[column]
+
+    negative = df[counts] < 0
+    for column in counts:
+        flags[f"{NEGATIVE_COUNT}:{column}"] = negative[column]
+
+    if "pincode" in df.columns:
+        pincode = pd.to_numeric(df["pincode"], errors="coerce")
+        flags[PINCODE_OUT_OF_RANGE] = pincode.notna() & ~pincode.between(*PINCODE_RANGE)
+
+    flags[UNKNOWN_STATE] = df["state"].notna() & ~encoders["state"].known(df["state"])
+    flags[UNKNOWN_DISTRICT] = df["district"].notna() & ~encoders["district"].known(df["district"])
+    if rules.get("require_updates"):
+        flags[NO_UPDATES] = df[counts].fillna(0).sum(axis=1) <= 0
+
+    # Only among rows that pass every other check, so an invalid first row
+    # does not take its valid repeat down with it
+    ok = ~pd.DataFrame(flags, index=df.index).any(axis=1)
+    flags[DUPLICATE_KEY] = df[ok].duplicated(subset=key, keep="first").reindex(df.index, fill_value=False)
+
+    return pd.DataFrame(flags, index=df.index)
+
+
+def validate(df, rules, encoders):
+    """Split ``df`` into ``(clean, quarantined)``; quarantined rows get a ``reasons`` column."""
+    flags = row_flags(df, rules, encoders)
+    bad = flags.any(axis=1)
+
+    quarantined = df[bad].copy()
+    codes = pd.Series([f"{code};" for code in flags.columns], index=flags.columns)
+    quarantined.insert(0, "reasons", flags[bad].dot(codes).str.rstrip(";"))
+    quarantined.insert(0, "row", quarantined.index)
+
+    reasons = {code: int(n) for code, n in flags.sum().items() if n}
+    return df[~bad], quarantined, reasons
+
+
+# ===============================
+# CACHED CLEAN DATASETS
+# ===============================
+def clean_dataset_version(filename, encoders=None):
+    """``(dataset version, encoder version)``: what :func:`clean_dataset` depends on.
+
+    ``encoders`` overrides the active pipeline version (swap handlers pass the old one).
+    """
+    return dataset_version(filename), encoders or model_version(FORECAST_PIPELINE)
+
+
+def quarantine_path(filename, versions):
+    """Named by both parts of :func:`clean_dataset_version`; an encoder swap changes the split."""
+    dataset, encoders = versions
+    return os.path.join(QUARANTINE_DIR, f"{Path(filename).stem}.{dataset}-{encoders}.csv")
+
+
+def clean_dataset(filename):
+    """The dataset with every quarantined row removed (shared and read-only)."""
+    return _validated(filename, clean_dataset_version(filename))["clean"]
+
+
+def quality_report(filename):
+    """``{dataset, version, encoder_version, rows, clean_rows, quarantined_rows, reasons, quarantine_file}``."""
+    return _validated(filename, clean_dataset_version(filename))["report"]
+
+
+@cached(disk=True)
+def _validated(filename, versions):
+    df = load_dataset(filename)
+    clean, quarantined, reasons = validate(df, DATASET_RULES[filename], forecast_encoders())
+
+    # Rewritten whenever the split is rebuilt; other processes may race to write it
+    path = quarantine_path(filename, versions)
+    if len(quarantined):
+        os.makedirs(QUARANTINE_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        quarantined.to_csv(tmp, index=False)
+        os.replace(tmp, path)
+
+    report = {
+        "dataset": filename,
+        "version": versions[0],
+        "encoder_version": versions[1],
+        "rows": len(df),
+        "clean_rows": len(clean),
+        "quarantined_rows": len(quarantined),
+        "reasons": reasons,
+        "quarantine_file": path if len(quarantined) else None,
+    }
+    return {"clean": clean, "report": report}
+
+
+# ===============================
+# INVALIDATION ON MODEL SWAP
+# ===============================
+def _on_model_swap(name, old_version, new_version):
+    if name != FORECAST_PIPELINE:
+        return
+    for filename in DATASET_RULES:
+        try:
+            _validated.clear(filename, clean_dataset_version(filename, old_version))
+        except FileNotFoundError:
+            pass
+
+
+get_registry().subscribe(_on_model_swap)
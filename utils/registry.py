@@ -0,0 +1,350 @@
+"""Versioned model registry with a manifest, a directory watcher and atomic swaps.
+
+``models/manifest.json`` records, for every artifact in ``models/``, the
+active version (first 12 hex digits of its SHA-256) and each version seen so
+far with its hash, feature list and cluster -> label mapping. Older versions
+are archived under ``models/versions/<name>/<version>.pkl`` so they can be
+rolled back.
+
+A daemon thread polls ``models/`` for changed files. A changed artifact is
+hashed, unpickled and described in that background thread, then swapped in
+by replacing one dict entry, so readers never see a half-loaded model.
+Subscribers are told which artifact changed so they can drop only the caches
+built from it.
+
+Only ``python -m tools.models register`` and the watcher archive artifacts
+and write the manifest, and a failed write is logged, never raised: loading a
+model for a page never needs write access to ``models/``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from datetime import datetime, timezone
+
+import joblib
+
+logger = logging.getLogger(__name__)
+
+MODELS_DIR = "models"
+MANIFEST_FILE = "manifest.json"
+VERSIONS_DIR = "versions"
+
+# Seconds between polls of models/; 0 disables the watcher
+WATCH_INTERVAL = float(os.environ.get("SMARTAADHAAR_MODEL_WATCH_INTERVAL", "5"))
+
+# How the clusters of each K-Means artifact map to the levels the pages show.
+# "rank_by" orders clusters by that feature's centroid (low -> high);
+# "fixed" is a mapping the model was trained to follow.
+LABEL_RULES = {
+    "hotspot_kmeans_model.pkl": {
+        "rank_by": "total_biometric_updates",
+        "levels": ["Low Demand", "Medium Demand", "High Demand"],
+    },
+    "policy_kmeans_model.pkl": {
+        "fixed": {0: 0, 1: 1, 2: 2},
+        "levels": ["Low Priority", "Medium Priority", "High Priority"],
+    },
+    "infra_kmeans_model.pkl": {
+        # As the page always labelled it: cluster 0 low, every other cluster medium
+        "fixed": {0: 0, 1: 1, 2: 1},
+        "levels": ["Low Priority", "Medium Priority", "High Priority"],
+    },
+    "citizen_kmeans_model.pkl": {
+        # As the page always labelled it: cluster 0 low, every other cluster medium
+        "fixed": {0: 0, 1: 1, 2: 1},
+        "levels": ["Low Improvement Need", "Medium Improvement Need", "High Improvement Need"],
+    },
+}
+
+FORECAST_FEATURES = [
+    "state", "district", "pincode", "bio_age_5_17", "bio_age_17_plus",
+    "enrolment_count", "month", "year",
+]
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def paired_scaler(name):
+    """``<prefix>_kmeans_model.pkl`` is always fitted on ``<prefix>_scaler.pkl``."""
+    if name.endswith("_kmeans_model.pkl"):
+        return name.replace("_kmeans_model.pkl", "_scaler.pkl")
+    return None
+
+
+def rank_levels(values):
+    """Lowest value -> level 0, highest -> level 2, everything else -> level 1."""
+    order = sorted(range(len(values)), key=lambda i: values[i])
+    levels = {c: 1 for c in order}
+    levels[order[-1]] = 2
+    levels[order[0]] = 0
+    return levels
+
+
+class ModelRegistry:
+    def __init__(self, models_dir=MODELS_DIR, watch_interval=WATCH_INTERVAL, archive=False):
+        self.models_dir = models_dir
+        self.watch_interval = watch_interval
+        # Whether first loads archive the artifact and record it in the manifest file
+        self.archive = archive
+        self._lock = threading.RLock()
+        self._active = {}       # name -> {"version", "model", "info"}
+        self._seen = {}         # name -> (size, mtime_ns) of the file on disk
+        self._pending = {}      # name -> stat signature waiting to settle
+        self._subscribers = []
+        self._manifest = self._read_manifest()
+        self._thread = None
+        self._stop = threading.Event()
+
+    # -------------------------------
+    # Manifest
+    # -------------------------------
+    @property
+    def manifest_path(self):
+        return os.path.join(self.models_dir, MANIFEST_FILE)
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"models": {}}
+
+    def _write_manifest(self):
+        tmp = f"{self.manifest_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "w") as f:
+                json.dump(self._manifest, f, indent=2, sort_keys=True)
+                f.write("\n")
+            os.replace(tmp, self.manifest_path)
+        except OSError as e:
+            logger.warning("Could not write %s: %s", self.manifest_path, e)
+
+    def manifest(self):
+        with self._lock:
+            return json.loads(json.dumps(self._manifest))
+
+    # -------------------------------
+    # Reads (lock-free once loaded)
+    # -------------------------------
+    def get(self, name):
+        entry = self._active.get(name) or self._load_current(name)
+        return entry["model"]
+
+    def version(self, name):
+        entry = self._active.get(name) or self._load_current(name)
+        return entry["version"]
+
+    def info(self, name):
+        entry = self._active.get(name) or self._load_current(name)
+        return entry["info"]
+
+    def subscribe(self, callback):
+        """Call ``callback(name, old_version, new_version)`` after every swap."""
+        self._subscribers.append(callback)
+
+    # -------------------------------
+    # Loading & swapping
+    # -------------------------------
+    def _path(self, name):
+        return os.path.join(self.models_dir, name)
+
+    def _signature(self, name):
+        st = os.stat(self._path(name))
+        return st.st_size, st.st_mtime_ns
+
+    def _load_current(self, name):
+        with self._lock:
+            entry = self._active.get(name)
+            if entry is None:
+                entry = self._load(name, persist=self.archive)
+                self._swap(name, entry, notify=False)
+            return entry
+
+    def _load(self, name, persist):
+        path = self._path(name)
+        signature = self._signature(name)
+        sha256 = file_sha256(path)
+        model = joblib.load(path)
+        version = sha256[:12]
+        info = self._register(name, version, sha256, signature[0], model, persist)
+        self._seen[name] = signature
+        return {"version": version, "model": model, "info": info}
+
+    def _register(self, name, version, sha256, size, model, persist):
+        with self._lock:
+            models = self._manifest.setdefault("models", {})
+            record = models.setdefault(name, {"current": None, "versions": {}})
+            info = record["versions"].get(version)
+            changed = info is None or record["current"] != version
+            if info is None:
+                info = {
+                    "sha256": sha256,
+                    "bytes": size,
+                    "registered_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "type": type(model).__name__,
+                    "features": self._features(name, model),
+                    **self._cluster_labels(name, model),
+                }
+                record["versions"][version] = info
+            info["artifact"] = os.path.join(VERSIONS_DIR, os.path.splitext(name)[0], f"{version}.pkl")
+            record["current"] = version
+            if persist:
+                self._archive(name, info["artifact"])
+                if changed:
+                    self._write_manifest()
+            return info
+
+    def _archive(self, name, artifact):
+        archive = os.path.join(self.models_dir, artifact)
+        try:
+            if not os.path.exists(archive):
+                os.makedirs(os.path.dirname(archive), exist_ok=True)
+                shutil.copy2(self._path(name), archive)
+        except OSError as e:
+            logger.warning("Could not archive %s to %s: %s", name, archive, e)
+
+    def _features(self, name, model):
+        if hasattr(model, "feature_names_in_"):
+            return [str(f) for f in model.feature_names_in_]
+        if isinstance(model, dict) and "model" in model:
+            return FORECAST_FEATURES
+        if paired_scaler(name):
+            return [str(f) for f in self.get(paired_scaler(name)).feature_names_in_]
+        return []
+
+    def _cluster_labels(self, name, model, scaler=None):
+        rule = LABEL_RULES.get(name)
+        if rule is None:
+            return {}
+        if "fixed" in rule:
+            levels = dict(rule["fixed"])
+        else:
+            scaler = scaler if scaler is not None else self.get(paired_scaler(name))
+            centroids = scaler.inverse_transform(model.cluster_centers_)
+            column = list(scaler.feature_names_in_).index(rule["rank_by"])
+            levels = rank_levels([float(c) for c in centroids[:, column]])
+        return {
+            "levels": rule["levels"],
+            "cluster_levels": {str(c): level for c, level in sorted(levels.items())},
+            "cluster_labels": {str(c): rule["levels"][level] for c, level in sorted(levels.items())},
+        }
+
+    def _swap(self, name, entry, notify=True, relabelled=None):
+        old = self._active.get(name)
+        # One reference assignment: readers see either the old or the new entry,
+        # and a new scaler only together with the labels ranked against it
+        self._active = {**self._active, **(relabelled or {}), name: entry}
+        if notify and old is not None and old["version"] != entry["version"]:
+            logger.info("Swapped %s %s -> %s", name, old["version"], entry["version"])
+            for callback in list(self._subscribers):
+                try:
+                    callback(name, old["version"], entry["version"])
+                except Exception:
+                    logger.exception("Model swap subscriber failed for %s", name)
+
+    def refresh(self):
+        """Load and swap in every artifact that changed on disk; return their names.
+
+        A file must keep the same size and mtime for two consecutive polls
+        before it is loaded, so a copy still in progress is never unpickled.
+        """
+        changed = []
+        # Scalers first, so a K-Means artifact replaced alongside its scaler is
+        # labelled against the new scaler
+        for filename in sorted(os.listdir(self.models_dir), key=lambda f: ("kmeans" in f, f)):
+            if not filename.endswith(".pkl") or filename not in self._active:
+                continue
+            try:
+                signature = self._signature(filename)
+            except FileNotFoundError:
+                continue
+            if signature == self._seen.get(filename):
+                self._pending.pop(filename, None)
+                continue
+            if self._pending.get(filename) != signature:
+                self._pending[filename] = signature
+                continue
+            del self._pending[filename]
+            try:
+                entry = self._load(filename, persist=True)
+            except Exception:
+                logger.exception("Keeping %s %s; new artifact failed to load",
+                                 filename, self._active[filename]["version"])
+                self._seen[filename] = signature
+                continue
+            if entry["version"] != self._active[filename]["version"]:
+                with self._lock:
+                    relabelled = self._relabel_dependents(filename, entry["model"])
+                    self._swap(filename, entry, relabelled=relabelled)
+                changed.append(filename)
+        return changed
+
+    def _relabel_dependents(self, scaler_name, scaler):
+        """New entries for the K-Means artifacts whose centroid ranking uses ``scaler``.
+
+        Built before the scaler is swapped in, so no reader (and no cache keyed
+        by the new scaler version) ever sees the new scaler with the old labels.
+        """
+        relabelled = {}
+        for name in LABEL_RULES:
+            entry = self._active.get(name)
+            if paired_scaler(name) != scaler_name or entry is None:
+                continue
+            info = {**entry["info"], **self._cluster_labels(name, entry["model"], scaler)}
+            relabelled[name] = {**entry, "info": info}
+            self._manifest["models"][name]["versions"][entry["version"]] = info
+        if relabelled:
+            self._write_manifest()
+        return relabelled
+
+    # -------------------------------
+    # Watcher
+    # -------------------------------
+    def start_watching(self):
+        if self.watch_interval <= 0 or (self._thread and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="model-registry-watcher", daemon=True)
+        self._thread.start()
+
+    def stop_watching(self):
+        self._stop.set()
+
+    def _watch(self):
+        while not self._stop.wait(self.watch_interval):
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Model registry refresh failed")
+
+    def _after_fork(self):
+        # Threads do not survive fork(); give each forked worker its own watcher
+        self._lock = threading.RLock()
+        self._thread = None
+        self._stop = threading.Event()
+        self.start_watching()
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry():
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ModelRegistry()
+                _registry.start_watching()
+                os.register_at_fork(after_in_child=_registry._after_fork)
+    return _registry
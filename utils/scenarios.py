@@ -0,0 +1,189 @@
+"""Vectorized what-if scenarios for the policy and infrastructure priority models.
+
+A scenario is a set of percentage shifts per feature, e.g.
+``{"enrolment_count": 20}``. Any number of scenarios is applied to every
+district at once: the (scenarios x districts x features) array is stacked
+into one matrix and scored with a single ``scaler.transform`` + ``predict``.
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.cache import cached
+from utils.encoding import FORECAST_PIPELINE
+from utils.loaders import load_model
+from utils.priority import LEVEL_ICONS, PRIORITY_MODELS, cache_versions, cluster_levels, level_names
+from utils.quality import clean_dataset
+from utils.registry import get_registry
+
+# Features a planner can shift, per model. Features that are not adjustable on
+# their own follow the feature they are derived from.
+ADJUSTABLE = {
+    "policy": ["bio_age_5_17", "bio_age_17_", "total_population"],
+    "infra": ["bio_age_5_17", "bio_age_17_", "enrolment_count"],
+}
+LINKED = {"age_group_population": "total_population"}
+
+FEATURE_NAMES = {
+    "bio_age_5_17": "Biometric (Age 5–17)",
+    "bio_age_17_": "Biometric (Age 17+)",
+    "total_population": "Total Population",
+    "enrolment_count": "Enrollment Count",
+}
+
+
+# ===============================
+# BATCHED SCORING
+# ===============================
+def scenario_base(kind):
+    return _scenario_base(kind, cache_versions(kind))
+
+
+@cached
+def _scenario_base(kind, versions):
+    """One row per district (the row the pages display) and its baseline level."""
+    spec = PRIORITY_MODELS[kind]
+    frame = (
+        clean_dataset(spec["dataset"])
+        .drop_duplicates(subset=["state", "district"])
+        .reset_index(drop=True)
+    )
+    X = frame[spec["features"]].to_numpy(dtype=np.float64)
+    return {
+        "frame": frame[["state", "district"]],
+        "X": X,
+        "baseline": score_levels(kind, X[None, :, :])[0],
+    }
+
+
+def multipliers(kind, scenarios):
+    """(scenarios x features) array of ``1 + shift / 100``."""
+    features = PRIORITY_MODELS[kind]["features"]
+    M = np.ones((len(scenarios), len(features)))
+    for s, shifts in enumerate(scenarios):
+        for j, feature in enumerate(features):
+            pct = shifts.get(feature, shifts.get(LINKED.get(feature), 0.0))
+            M[s, j] = 1.0 + pct / 100.0
+    return M
+
+
+def score_levels(kind, X):
+    """Priority level (0/1/2) for a (scenarios x districts x features) array."""
+    spec = PRIORITY_MODELS[kind]
+    model = load_model(spec["model"])
+    scaler = load_model(spec["scaler"])
+
+    n_scenarios, n_districts, n_features = X.shape
+    stacked = pd.DataFrame(X.reshape(-1, n_features), columns=spec["features"])
+    clusters = model.predict(scaler.transform(stacked))
+
+    mapping = cluster_levels(kind)
+    lut = np.array([mapping[c] for c in range(len(mapping))])
+    return lut[clusters].reshape(n_scenarios, n_districts)
+
+
+def run_scenarios(kind, scenarios, state=None):
+    """Score every scenario against every district (optionally one state).
+
+    Returns ``(districts, baseline, levels)`` where ``levels`` has shape
+    (scenarios x districts).
+    """
+    base = scenario_base(kind)
+    frame, X, baseline = base["frame"], base["X"], base["baseline"]
+    if state is not None:
+        mask = (frame["state"] == state).to_numpy()
+        frame, X, baseline = frame[mask].reset_index(drop=True), X[mask], baseline[mask]
+
+    M = multipliers(kind, scenarios)
+    levels = score_levels(kind, M[:, None, :] * X[None, :, :])
+    return frame, baseline, levels
+
+
+def level_counts(kind, levels):
+    """Districts per level for each scenario, as columns Low / Medium / High."""
+    counts = np.stack([(levels == level).sum(axis=1) for level in range(3)], axis=1)
+    return pd.DataFrame(counts, columns=level_names(kind))
+
+
+def changed_districts(kind, districts, baseline, scenario_levels):
+    """Districts whose level differs from the baseline under one scenario."""
+    names = level_names(kind)
+    changed = scenario_levels != baseline
+    result = districts[changed].copy()
+    result["current_priority"] = [f"{LEVEL_ICONS[l]} {names[l]}" for l in baseline[changed]]
+    result["scenario_priority"] = [f"{LEVEL_ICONS[l]} {names[l]}" for l in scenario_levels[changed]]
+    result["direction"] = np.where(scenario_levels[changed] > baseline[changed], "⬆️ up", "⬇️ down")
+    return result.reset_index(drop=True)
+
+
+# ===============================
+# SCENARIO PANEL (PAGES 4 & 5)
+# ===============================
+def render_scenario_panel(kind, state):
+    with st.expander("🧪 What-if Scenario Analysis"):
+        scope = st.radio(
+            "Scenario scope",
+            [f"Districts in {state}", "All districts"],
+            horizontal=True,
+            key=f"{kind}_scenario_scope"
+        )
+        scope_state = state if scope.startswith("Districts in") else None
+
+        # ----- Single scenario -----
+        st.markdown("**Adjust demand (% change)**")
+        cols = st.columns(len(ADJUSTABLE[kind]))
+        shifts = {
+            feature: col.slider(FEATURE_NAMES[feature], -50, 100, 0, step=5, key=f"{kind}_shift_{feature}")
+            for col, feature in zip(cols, ADJUSTABLE[kind])
+        }
+
+        districts, baseline, levels = run_scenarios(kind, [shifts], scope_state)
+        summary = pd.concat(
+            [level_counts(kind, baseline[None, :]), level_counts(kind, levels)],
+            ignore_index=True
+        )
+        summary.index = ["Current", "Scenario"]
+        st.dataframe(summary)
+
+        changed = changed_districts(kind, districts, baseline, levels[0])
+        st.metric("Districts changing priority", len(changed))
+        if len(changed):
+            st.dataframe(changed, hide_index=True)
+
+        # ----- Sweep -----
+        st.markdown("**Sweep one feature**")
+        c1, c2 = st.columns(2)
+        feature = c1.selectbox(
+            "Feature to sweep",
+            ADJUSTABLE[kind],
+            format_func=FEATURE_NAMES.__getitem__,
+            key=f"{kind}_sweep_feature"
+        )
+        lo, hi = c2.slider("Shift range (%)", -90, 200, (-50, 50), step=10, key=f"{kind}_sweep_range")
+        points = np.linspace(lo, hi, 101)
+
+        _, _, sweep_levels = run_scenarios(kind, [{feature: p} for p in points], scope_state)
+        sweep = level_counts(kind, sweep_levels)
+        sweep.index = points.round(1)
+        sweep.index.name = "shift_percent"
+        st.line_chart(sweep)
+        st.caption(
+            f"{len(points)} scenarios × {sweep_levels.shape[1]} districts scored in one batched pass."
+        )
+
+
+# ===============================
+# INVALIDATION ON MODEL SWAP
+# ===============================
+def _on_model_swap(name, old_version, new_version):
+    for kind in ADJUSTABLE:
+        spec = PRIORITY_MODELS[kind]
+        if name in (spec["model"], spec["scaler"], FORECAST_PIPELINE):
+            try:
+                _scenario_base.clear(kind, cache_versions(kind, name, old_version))
+            except FileNotFoundError:
+                pass
+
+
+get_registry().subscribe(_on_model_swap)
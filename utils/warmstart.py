@@ -0,0 +1,52 @@
+"""Pre-import the heavy libraries once so forked workers start warm."""
+
+import importlib
+import multiprocessing as mp
+import sys
+import time
+
+# Everything the six pages (and the pickled models) pull in at runtime
+HEAVY_MODULES = (
+    "streamlit",
+    "numpy",
+    "pandas",
+    "joblib",
+    "sklearn.preprocessing",
+    "sklearn.cluster",
+    "xgboost",
+    "matplotlib.pyplot",
+)
+
+
+def preload(modules=HEAVY_MODULES):
+    """Import ``modules`` in this process and return ``{module: seconds}``.
+
+    Modules that are already imported cost nothing; missing optional
+    libraries are reported with a ``None`` timing instead of failing.
+    """
+    if "matplotlib.pyplot" in modules and "matplotlib.pyplot" not in sys.modules:
+        import matplotlib
+
+        # Workers render off-screen; never let pyplot probe for a GUI backend
+        matplotlib.use("Agg")
+
+    timings = {}
+    for name in modules:
+        t0 = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            timings[name] = None
+            continue
+        timings[name] = time.perf_counter() - t0
+    return timings
+
+
+def fork_context(modules=HEAVY_MODULES):
+    """Preload ``modules`` and return a ``fork`` multiprocessing context.
+
+    Children forked from it share the parent's imported modules copy-on-write,
+    so they skip the import cost entirely.
+    """
+    preload(modules)
+    return mp.get_context("fork")
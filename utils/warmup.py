@@ -0,0 +1,80 @@
+"""Fill the process-wide caches before the server accepts traffic.
+
+Loads every model and dataset the pages reference, runs the data-quality gate,
+the full-dataset scoring, state indexes and nearest-neighbour trees, and renders
+the state charts most sessions see first, timing each step.
+"""
+
+import time
+
+from utils.drift import drift_report
+from utils.features import age_group_frame, hotspot_frame
+from utils.loaders import DATASET_FILES, MODEL_FILES, load_dataset, load_model
+from utils.neighbours import SPACES, neighbour_index
+from utils.priority import PRIORITY_MODELS, cluster_levels, prepared_data, state_chart, state_index, states
+from utils.quality import clean_dataset
+
+
+def _describe(value):
+    if hasattr(value, "shape") and len(getattr(value, "shape", ())) == 2:
+        return f"{value.shape[0]:,} rows"
+    if isinstance(value, dict):
+        return f"{len(value):,} entries"
+    if isinstance(value, (bytes, bytearray)):
+        return f"{len(value) / 1024:.0f} KiB"
+    return type(value).__name__
+
+
+def common_states(kind, limit):
+    """The page's default state, then the states with the most rows."""
+    index = state_index(kind)
+    by_size = sorted(index, key=lambda s: -len(index[s]))
+    ordered = [states(kind)[0]] + by_size
+    return list(dict.fromkeys(ordered))[:limit]
+
+
+def warm_up(top_states=5, log=None):
+    """Run every warm-up step and return ``[{step, status, seconds, detail}]``.
+
+    A step whose dataset is missing is reported as ``skipped`` rather than
+    aborting the rest of the warm-up.
+    """
+    report = []
+
+    def step(name, fn):
+        t0 = time.perf_counter()
+        try:
+            status, detail = "ok", _describe(fn())
+        except FileNotFoundError as e:
+            status, detail = "skipped", f"missing {e.filename}"
+        except Exception as e:
+            status, detail = "failed", f"{type(e).__name__}: {e}"
+        entry = {"step": name, "status": status, "seconds": time.perf_counter() - t0, "detail": detail}
+        report.append(entry)
+        if log:
+            log(f"{entry['seconds'] * 1000:>8.0f} ms  {status:<7}  {name}  ({detail})")
+        return status == "ok"
+
+    for filename in MODEL_FILES:
+        step(f"model {filename}", lambda f=filename: load_model(f))
+    for filename in DATASET_FILES:
+        if step(f"dataset {filename}", lambda f=filename: load_dataset(f)):
+            step(f"validate {filename}", lambda f=filename: clean_dataset(f))
+
+    step("hotspot clusters (page 2)", hotspot_frame)
+    step("age-group clusters (page 3)", age_group_frame)
+
+    for kind in PRIORITY_MODELS:
+        if not step(f"{kind} scoring", lambda k=kind: prepared_data(k)):
+            continue
+        step(f"{kind} cluster levels", lambda k=kind: cluster_levels(k))
+        step(f"{kind} state index", lambda k=kind: state_index(k))
+        for state in common_states(kind, top_states):
+            step(f"{kind} chart: {state}", lambda k=kind, s=state: state_chart(k, s))
+
+    for kind in SPACES:
+        step(f"{kind} neighbour index", lambda k=kind: neighbour_index(k)["frame"])
+
+    step("drift statistics", drift_report)
+
+    return report